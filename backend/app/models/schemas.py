@@ -5,6 +5,8 @@ Defines data structures for memory state, heap management, registers, and execut
 
 from __future__ import annotations
 
+import sys
+
 from pydantic import BaseModel, Field
 
 # ============== Heap Models ==============
@@ -79,6 +81,16 @@ class MemoryState(BaseModel):
     heap: MemorySegment = Field(description="Heap segment (dynamic allocations)")
     stack: MemorySegment = Field(description="Stack segment")
 
+    def with_updated(self, segment_name: str, segment: MemorySegment) -> MemoryState:
+        """
+        Return a copy with one segment replaced.
+
+        The other three segments are shared with this instance, so a step
+        that only touched one segment allocates one MemorySegment instead
+        of rebuilding all four.
+        """
+        return self.model_copy(update={segment_name: segment})
+
 
 # ============== Register Models ==============
 
@@ -118,6 +130,10 @@ MIPS_REGISTERS: list[str] = [
     "$ra",
 ]
 
+# Interned so the hot register-name dict lookups in the services hit
+# CPython's pointer-equality fast path instead of hash-then-compare
+MIPS_REGISTERS = [sys.intern(name) for name in MIPS_REGISTERS]
+
 
 class RegisterState(BaseModel):
     """State of all 32 MIPS general-purpose registers."""
@@ -129,7 +145,9 @@ class RegisterState(BaseModel):
     @classmethod
     def create_initial(cls) -> RegisterState:
         """Create initial register state with all registers set to 0."""
-        return cls(values={reg: 0 for reg in MIPS_REGISTERS})
+        # dict.fromkeys builds the 32-key zero map in C; each caller gets
+        # a fresh dict, so the returned state is safe to mutate
+        return cls(values=dict.fromkeys(MIPS_REGISTERS, 0))
 
 
 # ============== MIPS Analysis Models ==============
@@ -28,7 +28,7 @@ from app.models.schemas import (
     StateResponse,
     StepResponse,
 )
-from app.services.mars_executor import MarsExecutor, MarsResult
+from app.services.mars_executor import MarsExecutor, MarsResult, get_mars_executor
 from app.services.mips_analyzer import MipsAnalysisError, get_mips_analyzer
 from app.services.state_manager import get_state_manager
 from app.services.trace_parser import TraceParser, get_trace_parser
@@ -39,7 +39,7 @@ router = APIRouter(prefix="/api", tags=["execution"])
 def _get_mars_executor() -> MarsExecutor:
     """Get MARS executor instance, handling initialization errors."""
     try:
-        return MarsExecutor()
+        return get_mars_executor()
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -34,7 +34,7 @@ from app.models.schemas import (
     HeapState,
 )
 from app.services.asm_injector import get_asm_injector
-from app.services.mars_executor import MarsExecutor
+from app.services.mars_executor import MarsExecutor, get_mars_executor
 from app.services.output_parser import OutputParser, get_output_parser
 
 router = APIRouter(prefix="/api/heap", tags=["heap"])
@@ -43,7 +43,7 @@ router = APIRouter(prefix="/api/heap", tags=["heap"])
 def _get_executor() -> MarsExecutor:
     """Get MARS executor, handling initialization errors."""
     try:
-        return MarsExecutor()
+        return get_mars_executor()
     except FileNotFoundError:
         raise HTTPException(status_code=500, detail="MARS simulator not found")
 
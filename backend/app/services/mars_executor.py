@@ -5,12 +5,29 @@ Handles subprocess execution of MARS simulator for MIPS code.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import os
+import shutil
 import subprocess
 import tempfile
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+# MARS runs are short-lived, so JVM startup dominates each call. Stopping
+# tiered compilation at level 1 and using a small serial-GC heap keeps
+# per-spawn init cost down (same tuning as the step executor).
+_JAVA_BASE_FLAGS: list[str] = [
+    "-XX:+TieredCompilation",
+    "-XX:TieredStopAtLevel=1",
+    "-XX:+UseSerialGC",
+    "-Xmx128m",
+]
+
 
 @dataclass
 class MarsResult:
@@ -23,6 +40,54 @@ class MarsResult:
     timeout: bool = False
 
 
+class _ResultCache:
+    """
+    Small thread-safe LRU cache with per-entry TTL for MarsResult objects.
+
+    Both successful and failed executions are cached (students often resubmit
+    the same broken code several times before fixing it, so the error path is
+    just as hot as the success path). Failures get a shorter TTL so a fixed
+    MARS environment is picked up quickly. Timeouts are never cached since
+    they may be transient.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._entries: OrderedDict[str, tuple[float, MarsResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: str) -> MarsResult | None:
+        """Return a cached result, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            # Return a copy so callers can't mutate the cached entry
+            return replace(result)
+
+    def put(self, key: str, result: MarsResult, ttl: float) -> None:
+        """Store a copy of the result with the given TTL in seconds."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, replace(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared across executor instances - keyed by jar path + invocation mode + code hash
+_result_cache = _ResultCache(maxsize=256)
+
+
 @dataclass
 class StepTrace:
     """Single step in execution trace."""
@@ -45,6 +110,52 @@ class MarsExecutor:
 
     DEFAULT_TIMEOUT: float = 5.0  # 5 seconds timeout for complex programs
 
+    # All 32 register names as MARS CLI arguments (one shared list for
+    # every invocation that dumps registers)
+    REGISTER_ARGS: list[str] = [
+        "zero",
+        "at",
+        "v0",
+        "v1",
+        "a0",
+        "a1",
+        "a2",
+        "a3",
+        "t0",
+        "t1",
+        "t2",
+        "t3",
+        "t4",
+        "t5",
+        "t6",
+        "t7",
+        "s0",
+        "s1",
+        "s2",
+        "s3",
+        "s4",
+        "s5",
+        "s6",
+        "s7",
+        "t8",
+        "t9",
+        "k0",
+        "k1",
+        "gp",
+        "sp",
+        "fp",
+        "ra",
+    ]
+
+    # Cache lifetimes (seconds). Failures expire faster so environment
+    # problems (e.g. a fixed classpath) are noticed quickly.
+    SUCCESS_TTL: float = 300.0
+    ERROR_TTL: float = 60.0
+
+    # Batch executions are independent MARS processes, so they run in
+    # parallel groups of this many (same bound the step executor uses)
+    MAX_PARALLEL_EXECUTIONS: int = 8
+
     def __init__(self, mars_jar_path: str | None = None):
         """
         Initialize MARS executor.
@@ -61,79 +172,40 @@ class MarsExecutor:
         if not self.mars_jar.exists():
             raise FileNotFoundError(f"MARS jar not found at: {self.mars_jar}")
 
-    def execute_with_trace(
-        self,
-        code: str,
-        timeout: float = DEFAULT_TIMEOUT,
-    ) -> MarsResult:
-        """
-        Execute MIPS code with instruction trace enabled.
-
-        Args:
-            code: MIPS assembly code to execute
-            timeout: Maximum execution time in seconds
-
-        Returns:
-            MarsResult with execution output including trace
-        """
-        # Write code to temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".asm",
-            delete=False,
-            encoding="utf-8",
-        ) as f:
-            f.write(code)
-            temp_file = f.name
-
-        try:
-            # Build MARS command with trace enabled
-            # Format: java -jar mars.jar nc dec [MaxSteps] program.asm
-            # MaxSteps limits execution steps to prevent infinite loops
-            cmd = [
-                "java",
-                "-jar",
-                str(self.mars_jar),
-                "nc",  # No copyright banner
-                "dec",  # Decimal display
-                "1000",  # Max 1000 steps to prevent infinite loops
-                temp_file,
-            ]
-
-            # Execute MARS
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=str(self.mars_jar.parent),
-            )
-
-            # Check for errors in output
-            error = self._check_for_errors(result.stdout, result.stderr)
+        # Per-instance scratch dir keeps the tmpdir root small, so temp file
+        # creation stays fast no matter how many executions have run. The
+        # cavl_ prefix makes leaked files visible to the background cleanup
+        # thread (see mips_analyzer).
+        self._scratch: str = tempfile.mkdtemp(prefix="cavl_")
+        atexit.register(shutil.rmtree, self._scratch, ignore_errors=True)
+
+        # Reuse the class-data-sharing archive the step executor maintains
+        # next to the jar (if it has been generated): class loading then
+        # reads the archive instead of re-scanning the jar on every spawn.
+        self._cds_archive: Path | None = None
+        archive = self.mars_jar.parent / "mars.jsa"
+        if archive.exists():
+            self._cds_archive = archive
+
+    def _java_cmd(self) -> list[str]:
+        """Base java command with startup-tuning flags."""
+        cmd = ["java", *_JAVA_BASE_FLAGS]
+        if self._cds_archive is not None:
+            cmd += ["-Xshare:auto", f"-XX:SharedArchiveFile={self._cds_archive}"]
+        cmd += ["-jar", str(self.mars_jar)]
+        return cmd
 
-            return MarsResult(
-                success=error is None,
-                stdout=result.stdout,
-                stderr=result.stderr,
-                error=error,
-                timeout=False,
-            )
+    def _cache_key(self, mode: str, code: str) -> str:
+        """Build a cache key from the jar path, invocation mode, and code hash."""
+        code_hash = hashlib.sha256(code.encode("utf-8")).hexdigest()
+        return f"{self.mars_jar}:{mode}:{code_hash}"
 
-        except subprocess.TimeoutExpired:
-            return MarsResult(
-                success=False,
-                stdout="",
-                stderr="",
-                error="Execution timeout exceeded",
-                timeout=True,
-            )
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
+    def _cache_result(self, key: str, result: MarsResult) -> None:
+        """Cache a result unless it came from a (transient) timeout."""
+        if result.timeout:
+            return
+        ttl = self.SUCCESS_TTL if result.success else self.ERROR_TTL
+        _result_cache.put(key, result, ttl)
 
     def execute(
         self,
@@ -154,10 +226,19 @@ class MarsExecutor:
         Returns:
             MarsResult with execution output
         """
+        # Check cache first - repeat submissions (broken or not) skip the JVM
+        cache_key = self._cache_key(
+            f"execute:{dump_registers}:{dump_memory}", code
+        )
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Write code to temporary file
         with tempfile.NamedTemporaryFile(
             mode="w",
             suffix=".asm",
+            dir=self._scratch,
             delete=False,
             encoding="utf-8",
         ) as f:
@@ -180,13 +261,15 @@ class MarsExecutor:
             # Check for errors in output
             error = self._check_for_errors(result.stdout, result.stderr)
 
-            return MarsResult(
+            mars_result = MarsResult(
                 success=error is None,
                 stdout=result.stdout,
                 stderr=result.stderr,
                 error=error,
                 timeout=False,
             )
+            self._cache_result(cache_key, mars_result)
+            return mars_result
 
         except subprocess.TimeoutExpired:
             return MarsResult(
@@ -211,6 +294,37 @@ class MarsExecutor:
             except OSError:
                 pass
 
+    def execute_batch(
+        self,
+        codes: list[str],
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> list[MarsResult]:
+        """
+        Execute several independent MIPS programs concurrently.
+
+        MARS assembles every file named on one command line into a single
+        program, so distinct submissions need distinct invocations; running
+        them in parallel amortizes the JVM startup cost in wall-clock time.
+        Cached results are returned without spawning at all.
+
+        Args:
+            codes: MIPS assembly programs to execute
+            timeout: Maximum execution time per program in seconds
+
+        Returns:
+            One MarsResult per program, in input order
+        """
+        if not codes:
+            return []
+        if len(codes) == 1:
+            return [self.execute(codes[0], timeout=timeout)]
+
+        workers = min(len(codes), self.MAX_PARALLEL_EXECUTIONS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(lambda code: self.execute(code, timeout=timeout), codes)
+            )
+
     def execute_with_trace(
         self,
         code: str,
@@ -226,10 +340,17 @@ class MarsExecutor:
         Returns:
             MarsResult with trace output including all register states
         """
+        # Check cache first - repeat submissions (broken or not) skip the JVM
+        cache_key = self._cache_key("trace", code)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Write code to temporary file
         with tempfile.NamedTemporaryFile(
             mode="w",
             suffix=".asm",
+            dir=self._scratch,
             delete=False,
             encoding="utf-8",
         ) as f:
@@ -241,51 +362,14 @@ class MarsExecutor:
             # nc = no copyright, dec = decimal output
             # We request all registers to be dumped
             cmd: list[str] = [
-                "java",
-                "-jar",
-                str(self.mars_jar),
+                *self._java_cmd(),
                 "nc",  # No copyright notice
                 "dec",  # Decimal output
                 temp_file,
             ]
 
             # Add all register names to dump
-            registers = [
-                "zero",
-                "at",
-                "v0",
-                "v1",
-                "a0",
-                "a1",
-                "a2",
-                "a3",
-                "t0",
-                "t1",
-                "t2",
-                "t3",
-                "t4",
-                "t5",
-                "t6",
-                "t7",
-                "s0",
-                "s1",
-                "s2",
-                "s3",
-                "s4",
-                "s5",
-                "s6",
-                "s7",
-                "t8",
-                "t9",
-                "k0",
-                "k1",
-                "gp",
-                "sp",
-                "fp",
-                "ra",
-            ]
-            for reg in registers:
-                cmd.append(reg)
+            cmd.extend(self.REGISTER_ARGS)
 
             result = subprocess.run(
                 cmd,
@@ -297,13 +381,15 @@ class MarsExecutor:
 
             error = self._check_for_errors(result.stdout, result.stderr)
 
-            return MarsResult(
+            mars_result = MarsResult(
                 success=error is None,
                 stdout=result.stdout,
                 stderr=result.stderr,
                 error=error,
                 timeout=False,
             )
+            self._cache_result(cache_key, mars_result)
+            return mars_result
 
         except subprocess.TimeoutExpired:
             return MarsResult(
@@ -347,6 +433,7 @@ class MarsExecutor:
         with tempfile.NamedTemporaryFile(
             mode="w",
             suffix=".asm",
+            dir=self._scratch,
             delete=False,
             encoding="utf-8",
         ) as f:
@@ -358,9 +445,7 @@ class MarsExecutor:
 
         try:
             cmd: list[str] = [
-                "java",
-                "-jar",
-                str(self.mars_jar),
+                *self._java_cmd(),
                 "nc",
                 "dec",
                 "dump",
@@ -370,6 +455,8 @@ class MarsExecutor:
                 temp_file,
             ]
 
+            # The dump file carries the payload, but stdout must still be
+            # captured: MARS prints assembler errors there, not to stderr
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -388,7 +475,7 @@ class MarsExecutor:
 
             return MarsResult(
                 success=error is None,
-                stdout=dump_content if dump_content else result.stdout,
+                stdout=dump_content,
                 stderr=result.stderr,
                 error=error,
                 timeout=False,
@@ -428,50 +515,14 @@ class MarsExecutor:
     ) -> list[str]:
         """Build MARS CLI command."""
         cmd: list[str] = [
-            "java",
-            "-jar",
-            str(self.mars_jar),
+            *self._java_cmd(),
             "nc",  # No copyright notice
             "dec",  # Decimal output
         ]
 
         if dump_registers:
             # Add all register names
-            registers = [
-                "zero",
-                "at",
-                "v0",
-                "v1",
-                "a0",
-                "a1",
-                "a2",
-                "a3",
-                "t0",
-                "t1",
-                "t2",
-                "t3",
-                "t4",
-                "t5",
-                "t6",
-                "t7",
-                "s0",
-                "s1",
-                "s2",
-                "s3",
-                "s4",
-                "s5",
-                "s6",
-                "s7",
-                "t8",
-                "t9",
-                "k0",
-                "k1",
-                "gp",
-                "sp",
-                "fp",
-                "ra",
-            ]
-            cmd.extend(registers)
+            cmd.extend(self.REGISTER_ARGS)
 
         cmd.append(asm_file)
         return cmd
@@ -494,3 +545,19 @@ class MarsExecutor:
                 return "\n".join(error_lines)
 
         return None
+
+
+# Shared instance for the routers, created lazily because construction
+# raises FileNotFoundError when mars.jar is missing (the routers map that
+# to an HTTP error). Building an executor per request leaked a scratch
+# dir and an atexit callback each time; the singleton pays both once and
+# keeps the result cache and scratch dir actually shared.
+_mars_executor: MarsExecutor | None = None
+
+
+def get_mars_executor() -> MarsExecutor:
+    """Get singleton MarsExecutor instance, creating it on first use."""
+    global _mars_executor
+    if _mars_executor is None:
+        _mars_executor = MarsExecutor()
+    return _mars_executor
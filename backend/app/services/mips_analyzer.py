@@ -19,13 +19,70 @@ NO INSTRUCTION CLASSIFICATION HAPPENS IN PYTHON.
 
 from __future__ import annotations
 
+import atexit
 import os
 import re
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Temp files are tagged with this prefix so the background cleanup thread
+# can find and remove any that leak (e.g. when an unlink in a finally block
+# fails and is silently swallowed). Without cleanup the tmpdir entry count
+# grows over days and slows down every new mkstemp.
+_TMPDIR: str = tempfile.gettempdir()
+_TEMP_PREFIX: str = "cavl_"
+_CLEANUP_MAX_AGE: float = 300.0  # seconds before a leaked file is removed
+_CLEANUP_INTERVAL: float = 300.0  # seconds between cleanup passes
+
+_cleanup_stop = threading.Event()
+_cleanup_thread: threading.Thread | None = None
+_cleanup_lock = threading.Lock()
+
+
+def _cleanup_stale_temp_files(max_age: float = _CLEANUP_MAX_AGE) -> None:
+    """Remove CAVL-tagged temp files older than max_age seconds.
+
+    Scratch directories (from crashed workers) are reaped once empty;
+    directories belonging to live instances stay untouched because their
+    contents are always fresh.
+    """
+    now = time.time()
+    for path in Path(_TMPDIR).glob(f"{_TEMP_PREFIX}*"):
+        try:
+            if path.is_dir():
+                for child in path.iterdir():
+                    if now - child.stat().st_mtime > max_age:
+                        child.unlink(missing_ok=True)
+                if now - path.stat().st_mtime > max_age:
+                    path.rmdir()  # Fails (caught) unless empty
+            elif now - path.stat().st_mtime > max_age:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass  # Racing workers or permission issues - safe to skip
+
+
+def _cleanup_loop() -> None:
+    """Periodic cleanup loop; exits when _cleanup_stop is set."""
+    while not _cleanup_stop.wait(_CLEANUP_INTERVAL):
+        _cleanup_stale_temp_files()
+
+
+def _start_cleanup_thread() -> None:
+    """Start the background cleanup thread (idempotent)."""
+    global _cleanup_thread
+    with _cleanup_lock:
+        if _cleanup_thread is None or not _cleanup_thread.is_alive():
+            _cleanup_stop.clear()
+            _cleanup_thread = threading.Thread(
+                target=_cleanup_loop, name="cavl-temp-cleanup", daemon=True
+            )
+            _cleanup_thread.start()
+
 
 class MipsCoreMissingError(Exception):
     """Raised when required MIPS core files are missing."""
@@ -139,6 +196,14 @@ class MipsInstructionAnalyzer:
         # Load the analyzer template
         self._analyzer_template: str = self._load_analyzer_template()
 
+        # Per-instance scratch dir keeps the tmpdir root small, so temp file
+        # creation stays fast no matter how many analyses have run
+        self._scratch: str = tempfile.mkdtemp(prefix=_TEMP_PREFIX, dir=_TMPDIR)
+        atexit.register(shutil.rmtree, self._scratch, ignore_errors=True)
+
+        # Reap any CAVL temp files that escaped their finally blocks
+        _start_cleanup_thread()
+
     def _load_analyzer_template(self) -> str:
         """Load the MIPS analyzer template."""
         with open(self.analyzer_path, "r", encoding="utf-8") as f:
@@ -152,7 +217,13 @@ class MipsInstructionAnalyzer:
         """
         # Write user code to temp file (ASCII encoding to avoid BOM issues)
         with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".asm", delete=False, encoding="ascii", errors="ignore"
+            mode="w",
+            prefix=_TEMP_PREFIX,
+            suffix=".asm",
+            dir=self._scratch,
+            delete=False,
+            encoding="ascii",
+            errors="ignore",
         ) as f:
             f.write(user_code)
             user_file = f.name
@@ -342,7 +413,13 @@ class MipsInstructionAnalyzer:
 
         # Step 3: Write combined code to temp file (ASCII to avoid BOM)
         with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".asm", delete=False, encoding="ascii", errors="ignore"
+            mode="w",
+            prefix=_TEMP_PREFIX,
+            suffix=".asm",
+            dir=self._scratch,
+            delete=False,
+            encoding="ascii",
+            errors="ignore",
         ) as f:
             f.write(analyzer_code)
             analyzer_file = f.name
@@ -364,9 +441,12 @@ class MipsInstructionAnalyzer:
                 analyzer_file,
             ]
 
-            result = subprocess.run(
+            # Results come from the memory dump file, not stdout - discard
+            # stdout instead of decoding it into a string we never read
+            _ = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=10.0,  # Increased timeout for analysis
                 cwd=str(self.mars_jar.parent),
@@ -381,7 +461,7 @@ class MipsInstructionAnalyzer:
             # Step 5: Parse results from MIPS output
             # Pass num_instructions so parser knows the correct offset
             analysis = self._parse_analysis_output(
-                result.stdout, memory_dump, len(instructions)
+                "", memory_dump, len(instructions)
             )
 
             # If parsing failed but we have instruction count, set it
@@ -16,7 +16,11 @@ Per the MIPS-centric architecture:
 from __future__ import annotations
 
 import re
+import struct
+from array import array
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 
 from app.models.schemas import (
     FreeBlock,
@@ -26,6 +30,52 @@ from app.models.schemas import (
 )
 
 
+@dataclass
+class MemoryBlockArray:
+    """
+    Structure-of-arrays form of a contiguous memory dump.
+
+    Stores one compact uint32 array of word values plus the base address
+    instead of a MemoryBlock object per word (~16 bytes vs ~120 bytes per
+    word). Iteration and indexing still yield MemoryBlock objects so API
+    boundaries that serialize the old shape keep working.
+    """
+
+    start_address: int
+    values: array  # typecode "I" - one unsigned 32-bit word per entry
+    word_size: int = 4
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[MemoryBlock]:
+        for i, value in enumerate(self.values):
+            yield MemoryBlock(
+                address=self.start_address + i * self.word_size,
+                size=self.word_size,
+                value=value,
+            )
+
+    def __getitem__(self, index: int) -> MemoryBlock:
+        return MemoryBlock(
+            address=self.start_address + index * self.word_size,
+            size=self.word_size,
+            value=self.values[index],
+        )
+
+    def value_at(self, address: int) -> int | None:
+        """O(1) value lookup by address (None if outside the dump)."""
+        offset = address - self.start_address
+        index, remainder = divmod(offset, self.word_size)
+        if remainder or not 0 <= index < len(self.values):
+            return None
+        return self.values[index]
+
+    def to_list(self) -> list[MemoryBlock]:
+        """Materialize the old list[MemoryBlock] shape."""
+        return list(self)
+
+
 @dataclass
 class ParsedHeapBlock:
     """Parsed heap block from MIPS memory."""
@@ -54,6 +104,8 @@ class OutputParser:
     # Regex patterns
     REGISTER_PATTERN: re.Pattern[str] = re.compile(r"\$(\w+)\s+(-?\d+)")
     HEX_VALUE_PATTERN: re.Pattern[str] = re.compile(r"^([0-9a-fA-F]+)$")
+    # Matches a whole dump consisting only of raw hex words (common case)
+    RAW_DUMP_PATTERN: re.Pattern[str] = re.compile(r"(?:[0-9a-fA-F]{1,8}\s*)+")
 
     # MIPS memory layout (MARS defaults)
     DATA_START: int = 0x10010000
@@ -65,35 +117,30 @@ class OutputParser:
     OFFSET_ALLOCATED: int = 4
     OFFSET_NEXT: int = 8
 
-    def parse_registers(self, mars_stdout: str) -> dict[str, int]:
+    @staticmethod
+    def parse_registers(mars_stdout: str) -> dict[str, int]:
         """
         Parse register values from MARS stdout.
 
         MARS outputs registers in format: $t0     42
 
+        The parse is memoized on the raw stdout, so repeated polls of the
+        same execution do not reparse. Callers get a fresh dict each time.
+
         Args:
             mars_stdout: Standard output from MARS execution
 
         Returns:
             Dictionary mapping register names to integer values
         """
-        registers: dict[str, int] = {}
-
-        for line in mars_stdout.strip().split("\n"):
-            match = self.REGISTER_PATTERN.search(line)
-            if match:
-                reg_name = f"${match.group(1)}"
-                value = int(match.group(2))
-                registers[reg_name] = value
-
-        return registers
+        return dict(_parse_registers_cached(mars_stdout))
 
+    @staticmethod
     def parse_memory_dump(
-        self,
         dump_content: str,
         start_address: int,
         word_size: int = 4,
-    ) -> list[MemoryBlock]:
+    ) -> MemoryBlockArray:
         """
         Parse memory dump from MARS HexText format.
 
@@ -105,40 +152,50 @@ class OutputParser:
             word_size: Size of each word (default 4 bytes)
 
         Returns:
-            List of MemoryBlock objects
+            MemoryBlockArray holding one word value per dump line
         """
-        blocks: list[MemoryBlock] = []
-        address = start_address
+        content = dump_content.strip()
+        if not content:
+            return MemoryBlockArray(start_address, array("I"), word_size)
+
+        # Fast path: the whole dump is raw hex words (the HexText format).
+        # Decode all words in one pass with bytes.fromhex instead of running
+        # the regex and int(line, 16) once per line.
+        if OutputParser.RAW_DUMP_PATTERN.fullmatch(content):
+            lines = content.split()
+            try:
+                buf = bytes.fromhex("".join(line.zfill(8) for line in lines))
+                words = array("I", struct.unpack(f">{len(lines)}I", buf))
+            except (ValueError, struct.error):
+                # Oversized tokens (>8 hex digits) slip past the pattern;
+                # fall through to the per-line path for those
+                pass
+            else:
+                return MemoryBlockArray(start_address, words, word_size)
+
+        # Slow path: mixed-format dumps (0x prefixes, stray lines)
+        values = array("I")
 
-        for line in dump_content.strip().split("\n"):
+        for line in content.split("\n"):
             line = line.strip()
             if not line:
                 continue
 
-            # Handle both "0x..." format and raw hex
+            # Handle both "0x..." format and raw hex. Values are masked to
+            # 32 bits so they fit the uint32 array (same truncation as
+            # trace_parser.parse_memory_dump_fast)
             if line.startswith("0x"):
-                value = int(line, 16)
+                values.append(int(line, 16) & 0xFFFFFFFF)
             else:
-                match = self.HEX_VALUE_PATTERN.match(line)
+                match = OutputParser.HEX_VALUE_PATTERN.match(line)
                 if match:
-                    value = int(match.group(1), 16)
-                else:
-                    continue
-
-            blocks.append(
-                MemoryBlock(
-                    address=address,
-                    size=word_size,
-                    value=value,
-                )
-            )
-            address += word_size
+                    values.append(int(match.group(1), 16) & 0xFFFFFFFF)
 
-        return blocks
+        return MemoryBlockArray(start_address, values, word_size)
 
     def parse_heap_metadata(
         self,
-        memory_blocks: list[MemoryBlock],
+        memory_blocks: list[MemoryBlock] | MemoryBlockArray,
         heap_start: int,
         heap_end: int,
     ) -> list[ParsedHeapBlock]:
@@ -158,15 +215,63 @@ class OutputParser:
         Returns:
             List of ParsedHeapBlock objects
         """
-        if not memory_blocks:
+        if not len(memory_blocks):
             return []
 
-        # Build address -> value map
-        mem_map = {b.address: b.value for b in memory_blocks if b.value is not None}
-
         blocks: list[ParsedHeapBlock] = []
         current = heap_start
 
+        if isinstance(memory_blocks, MemoryBlockArray):
+            # SoA dump: address -> index is pure arithmetic. Hoist locals so
+            # each header read is a plain array index, not a hash lookup.
+            values = memory_blocks.values
+            base = memory_blocks.start_address
+            word = memory_blocks.word_size
+            count = len(values)
+
+            # Word size is a power of two in practice, so the per-iteration
+            # divmod reduces to a shift and mask
+            pow2 = word > 0 and word & (word - 1) == 0
+            shift = word.bit_length() - 1
+            mask = word - 1
+
+            while current < heap_end:
+                offset = current - base
+                if pow2:
+                    index = offset >> shift
+                    misaligned = offset & mask
+                else:
+                    index, misaligned = divmod(offset, word)
+                # Header is 3 consecutive words: size, allocated, next.
+                # Only the size word is required - a header truncated by the
+                # end of the dump defaults allocated/next like the list
+                # branch below
+                if misaligned or index < 0 or index >= count:
+                    break
+
+                size = values[index]
+                if size <= 0:
+                    break
+
+                allocated = values[index + 1] if index + 1 < count else 0
+                next_ptr = values[index + 2] if index + 2 < count else 0
+                blocks.append(
+                    ParsedHeapBlock(
+                        address=current,
+                        size=size,
+                        allocated=bool(allocated),
+                        next_ptr=next_ptr,
+                    )
+                )
+
+                # Move to next block
+                current += size
+
+            return blocks
+
+        # Plain block list (possibly sparse): address -> value map
+        mem_map = {b.address: b.value for b in memory_blocks if b.value is not None}
+
         while current < heap_end:
             # Read block header
             size = mem_map.get(current + self.OFFSET_SIZE)
@@ -193,7 +298,7 @@ class OutputParser:
 
     def build_heap_state(
         self,
-        memory_blocks: list[MemoryBlock],
+        memory_blocks: list[MemoryBlock] | MemoryBlockArray,
         heap_start: int,
         heap_end: int,
     ) -> HeapState:
@@ -254,19 +359,27 @@ class OutputParser:
 
         This is a pure calculation, not a decision.
         """
-        if not free_blocks or len(free_blocks) <= 1:
+        if len(free_blocks) <= 1:
             return 0.0
 
-        total_free = sum(b.size for b in free_blocks)
+        # Accumulate total and largest in one pass - one attribute read per
+        # block instead of separate sum() and max() traversals
+        total_free = 0
+        largest_free = 0
+        for block in free_blocks:
+            size = block.size
+            total_free += size
+            if size > largest_free:
+                largest_free = size
+
         if total_free == 0:
             return 0.0
 
-        largest_free = max(b.size for b in free_blocks)
         return ((total_free - largest_free) / total_free) * 100.0
 
+    @staticmethod
     def extract_heap_bounds(
-        self,
-        data_blocks: list[MemoryBlock],
+        data_blocks: list[MemoryBlock] | MemoryBlockArray,
         data_start: int = DATA_START,
     ) -> tuple[int, int]:
         """
@@ -281,7 +394,11 @@ class OutputParser:
         Returns:
             Tuple of (heap_start, heap_end)
         """
-        mem_map = {b.address: b.value for b in data_blocks if b.value is not None}
+        if isinstance(data_blocks, MemoryBlockArray):
+            lookup = data_blocks.value_at
+        else:
+            mem_map = {b.address: b.value for b in data_blocks if b.value is not None}
+            lookup = mem_map.get
 
         # The heap metadata is stored at the beginning of .data
         # Layout from heap_operations.asm:
@@ -292,12 +409,23 @@ class OutputParser:
         #   heap_end_addr:      .word (offset 16)
         #   free_list_head:     .word (offset 20)
 
-        heap_start = mem_map.get(data_start + 12, 0)
-        heap_end = mem_map.get(data_start + 16, 0)
+        heap_start = lookup(data_start + 12) or 0
+        heap_end = lookup(data_start + 16) or 0
 
         return heap_start, heap_end
 
 
+# One finditer pass over the whole buffer - the pattern anchors on "$",
+# so no per-line splitting or str allocation is needed. Cached as a tuple
+# so hits are immutable; parse_registers hands out fresh dicts.
+@lru_cache(maxsize=64)
+def _parse_registers_cached(mars_stdout: str) -> tuple[tuple[str, int], ...]:
+    return tuple(
+        (f"${m.group(1)}", int(m.group(2)))
+        for m in OutputParser.REGISTER_PATTERN.finditer(mars_stdout)
+    )
+
+
 # Singleton instance
 _output_parser: OutputParser | None = None
 
@@ -16,13 +16,35 @@ is implemented in mips/core/pipeline_simulator.asm
 
 from __future__ import annotations
 
+import atexit
+import copy
+import hashlib
 import os
 import re
+import shutil
+import struct
 import subprocess
 import tempfile
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# JVM startup dominates each MARS invocation. These flags skip the C2
+# JIT tier and reuse the class-data-sharing archive, which trims a large
+# slice of warmup from short-lived runs like ours.
+_JAVA_STARTUP_FLAGS: list[str] = [
+    "-XX:+TieredCompilation",
+    "-XX:TieredStopAtLevel=1",
+    "-Xshare:auto",
+]
+
+# Injection patterns, compiled once - they run a single time at template
+# load to rewrite the target lines into format placeholders
+_RE_COUNT: re.Pattern[bytes] = re.compile(rb"instruction_count:\s*\.word\s+\d+")
+_RE_BUFFER: re.Pattern[bytes] = re.compile(rb"[ \t]*instruction_buffer:\s*\.space\s+\d+")
+_RE_FWD: re.Pattern[bytes] = re.compile(rb"enable_forwarding:\s*\.word\s+\d+")
+
 
 class PipelineSimulationError(Exception):
     """Raised when pipeline simulation fails."""
@@ -30,7 +52,7 @@ class PipelineSimulationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     """State of a single pipeline stage."""
 
@@ -42,7 +64,7 @@ class PipelineStage:
     dest_reg: int = -1  # Destination register (-1 = none)
 
 
-@dataclass
+@dataclass(slots=True)
 class HazardInfo:
     """Information about detected hazards."""
 
@@ -60,7 +82,7 @@ class HazardInfo:
         return names.get(self.hazard_type, "unknown")
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineMetrics:
     """Pipeline performance metrics."""
 
@@ -81,7 +103,7 @@ class PipelineMetrics:
         return (1.0 / self.cpi) * 100.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CycleRecord:
     """Record of pipeline state for a single cycle."""
 
@@ -127,6 +149,7 @@ class PipelineSimulator:
 
     SIMULATOR_ASM = "pipeline_simulator.asm"
     PIPELINE_MAGIC = 0x50495045  # "PIPE" in hex
+    CACHE_MAXSIZE = 128  # Cached assemblies / simulation states
 
     def __init__(self, mars_jar_path: str | None = None):
         """Initialize the pipeline simulator."""
@@ -152,19 +175,76 @@ class PipelineSimulator:
 
         self._simulator_template = self._load_simulator_template()
 
-    def _load_simulator_template(self) -> str:
-        """Load the MIPS pipeline simulator template."""
-        with open(self.simulator_path, "r", encoding="utf-8") as f:
-            return f.read()
+        # Private scratch dir for the .asm/.dump files exchanged with MARS.
+        # Backed by /dev/shm where available so the churn stays RAM-resident,
+        # and removed in one rmtree at exit.
+        shm = "/dev/shm"
+        self._scratch: str = tempfile.mkdtemp(
+            prefix="cavl_", dir=shm if os.path.isdir(shm) else None
+        )
+        atexit.register(shutil.rmtree, self._scratch, ignore_errors=True)
+
+        # LRU caches keyed by SHA-1 of the user code. Each JVM spawn costs
+        # hundreds of ms, so repeat simulations of the same code (forwarding
+        # toggles, frontend re-renders) should not pay it again.
+        self._assemble_cache: OrderedDict[str, tuple[int, ...]] = OrderedDict()
+        self._state_cache: OrderedDict[tuple[str, bool], PipelineState] = OrderedDict()
+
+    def _load_simulator_template(self) -> bytes:
+        """
+        Load the MIPS pipeline simulator template.
+
+        The template is kept as bytes end-to-end: injection target lines are
+        rewritten into %-format placeholders here, once, so each simulation
+        is a single bytes substitution written straight to disk with no
+        encode/decode round trip.
+        """
+        with open(self.simulator_path, "rb") as f:
+            template = f.read()
+
+        # Escape any literal percents so %-formatting only sees our
+        # placeholders
+        template = template.replace(b"%", b"%%")
+
+        template = _RE_COUNT.sub(b"instruction_count:      .word %(count)d", template)
+        template = _RE_BUFFER.sub(b"%(buffer_data)b", template)
+        template = _RE_FWD.sub(b"enable_forwarding:      .word %(fwd)d", template)
+
+        return template
+
+    @staticmethod
+    def _code_hash(user_code: str) -> str:
+        """SHA-1 of user code, used as the cache key."""
+        return hashlib.sha1(user_code.encode()).hexdigest()
 
     def _assemble_to_words(self, user_code: str) -> list[int]:
         """
         Assemble user MIPS code and extract instruction words.
 
         Uses MARS to assemble the code and dump the text segment.
+        Successful assemblies are cached by code hash, so only the first
+        call for a given program pays the JVM startup cost.
         """
+        key = self._code_hash(user_code)
+        cached = self._assemble_cache.get(key)
+        if cached is not None:
+            self._assemble_cache.move_to_end(key)
+            return list(cached)
+
+        instructions = self._assemble_to_words_uncached(user_code)
+
+        # Only cache successes - empty results may be transient (timeouts)
+        if instructions:
+            self._assemble_cache[key] = tuple(instructions)
+            if len(self._assemble_cache) > self.CACHE_MAXSIZE:
+                self._assemble_cache.popitem(last=False)
+
+        return instructions
+
+    def _assemble_to_words_uncached(self, user_code: str) -> list[int]:
+        """Run MARS to assemble user code and parse the text segment dump."""
         with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".asm", delete=False, encoding="ascii", errors="ignore"
+            mode="w", suffix=".asm", delete=False, encoding="ascii", errors="ignore", dir=self._scratch
         ) as f:
             f.write(user_code)
             user_file = f.name
@@ -174,6 +254,7 @@ class PipelineSimulator:
         try:
             cmd = [
                 "java",
+                *_JAVA_STARTUP_FLAGS,
                 "-jar",
                 str(self.mars_jar),
                 "nc",
@@ -195,15 +276,22 @@ class PipelineSimulator:
 
             instructions: list[int] = []
             if os.path.exists(dump_file):
-                with open(dump_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                word = int(line, 16)
-                                instructions.append(word)
-                            except ValueError:
-                                pass
+                with open(dump_file, "rb") as f:
+                    raw = f.read()
+
+                # HexText is fixed 8-hex-digit words, so the whole dump
+                # decodes in two C-level calls instead of int(line, 16)
+                # per line
+                hex_only = raw.translate(None, b" \t\r\n")
+                try:
+                    buf = bytes.fromhex(hex_only.decode("ascii"))
+                    instructions = list(struct.unpack(f">{len(buf) // 4}I", buf))
+                except (ValueError, UnicodeDecodeError, struct.error):
+                    for line in raw.decode("ascii", errors="ignore").split():
+                        try:
+                            instructions.append(int(line, 16))
+                        except ValueError:
+                            pass
 
             return instructions
 
@@ -223,39 +311,32 @@ class PipelineSimulator:
 
     def _inject_instructions(
         self, instructions: list[int], enable_forwarding: bool = True
-    ) -> str:
+    ) -> bytes:
         """
         Inject instruction words into the MIPS pipeline simulator template.
+
+        The template already holds %-format placeholders (rewritten at load
+        time), so injection is a single bytes substitution pass.
         """
         count = len(instructions)
 
         if instructions:
-            instr_words = ", ".join(f"0x{w:08X}" for w in instructions[:100])
-            buffer_data = f"    instruction_buffer:     .word {instr_words}"
+            # Hex-encode all words in one C-level pack/hex call, then slice
+            # into 8-char groups - no per-word __format__ dispatch
+            words = instructions[:100]
+            hexed = struct.pack(f">{len(words)}I", *words).hex().upper().encode()
+            instr_words = b", ".join(
+                b"0x" + hexed[i : i + 8] for i in range(0, len(hexed), 8)
+            )
+            buffer_data = b"    instruction_buffer:     .word " + instr_words
         else:
-            buffer_data = "    instruction_buffer:     .space 400"
-
-        modified = self._simulator_template
-
-        # Replace instruction_count
-        modified = re.sub(
-            r"instruction_count:\s*\.word\s+\d+",
-            f"instruction_count:      .word {count}",
-            modified,
-        )
+            buffer_data = b"    instruction_buffer:     .space 400"
 
-        # Replace instruction_buffer
-        modified = re.sub(r"instruction_buffer:\s*\.space\s+\d+", buffer_data, modified)
-
-        # Set forwarding flag
-        fwd_val = 1 if enable_forwarding else 0
-        modified = re.sub(
-            r"enable_forwarding:\s*\.word\s+\d+",
-            f"enable_forwarding:      .word {fwd_val}",
-            modified,
-        )
-
-        return modified
+        return self._simulator_template % {
+            b"count": count,
+            b"buffer_data": buffer_data,
+            b"fwd": 1 if enable_forwarding else 0,
+        }
 
     def _parse_simulation_output(
         self, memory_dump: str, num_instructions: int
@@ -285,18 +366,29 @@ class PipelineSimulator:
         if not memory_dump:
             return state
 
-        values: list[int] = []
-        for line in memory_dump.strip().split("\n"):
-            line = line.strip()
-            if line:
+        # Bulk-decode the HexText dump: one fromhex/unpack pass instead of
+        # a str and int allocation per line. Falls back to per-line parsing
+        # for dumps with stray non-hex content.
+        lines = memory_dump.split()
+        try:
+            buf = bytes.fromhex("".join(line.zfill(8) for line in lines))
+            values = array("I", struct.unpack(f">{len(lines)}I", buf))
+        except (ValueError, struct.error):
+            values = array("I")
+            for line in lines:
                 try:
                     values.append(int(line, 16))
-                except ValueError:
+                except (ValueError, OverflowError):
                     pass
 
         if len(values) < 50:
             return state
 
+        # Zero-copy style signed view: reinterpret the same 32-bit words as
+        # two's-complement ints once, instead of a _signed() call per field.
+        signed = array("i")
+        signed.frombytes(values.tobytes())
+
         # Calculate offsets based on data layout
         # instruction_count: offset 0
         # instruction_buffer: offset 1, length = actual num_instructions
@@ -310,18 +402,22 @@ class PipelineSimulator:
         config_offset = base_offset
         stages_offset = config_offset + 2
 
-        # Parse pipeline stages (5 stages * 6 words each = 30 words)
+        # Parse pipeline stages (5 stages * 6 words each = 30 words).
+        # Each record is pulled out with one slice unpack instead of six
+        # indexed reads.
         stage_names = ["IF", "ID", "EX", "MEM", "WB"]
         for i, name in enumerate(stage_names):
             stage_base = stages_offset + (i * 6)
             if stage_base + 5 < len(values):
+                instr, pc, valid = values[stage_base : stage_base + 3]
+                src1, src2, dest = signed[stage_base + 3 : stage_base + 6]
                 state.stages[name] = PipelineStage(
-                    instruction=values[stage_base],
-                    pc=values[stage_base + 1],
-                    valid=values[stage_base + 2] != 0,
-                    src_reg1=self._signed(values[stage_base + 3]),
-                    src_reg2=self._signed(values[stage_base + 4]),
-                    dest_reg=self._signed(values[stage_base + 5]),
+                    instruction=instr,
+                    pc=pc,
+                    valid=valid != 0,
+                    src_reg1=src1,
+                    src_reg2=src2,
+                    dest_reg=dest,
                 )
 
         # Parse hazard info (7 words)
@@ -333,7 +429,7 @@ class PipelineSimulator:
                 stall_required=values[hazard_offset + 3] != 0,
                 forward_from=values[hazard_offset + 4],
                 forward_to=values[hazard_offset + 5],
-                forward_reg=self._signed(values[hazard_offset + 6]),
+                forward_reg=signed[hazard_offset + 6],
             )
 
         # Parse metrics (9 words)
@@ -368,39 +464,35 @@ class PipelineSimulator:
             history_count = values[history_meta_offset + 1]
             history_data_offset = history_meta_offset + 2
 
-            # Each history entry is 9 words
+            # Each history entry is 9 words - one slice unpack per entry
             for i in range(min(history_count, max_cycles, 50)):
                 entry_offset = history_data_offset + (i * 9)
                 if entry_offset + 8 < len(values):
+                    cycle, if_i, id_i, ex_i, mem_i, wb_i, hazard, stall, fwd = values[
+                        entry_offset : entry_offset + 9
+                    ]
                     state.cycle_history.append(
                         CycleRecord(
-                            cycle=values[entry_offset],
-                            if_instruction=values[entry_offset + 1],
-                            id_instruction=values[entry_offset + 2],
-                            ex_instruction=values[entry_offset + 3],
-                            mem_instruction=values[entry_offset + 4],
-                            wb_instruction=values[entry_offset + 5],
-                            hazard_type=values[entry_offset + 6],
-                            stall=values[entry_offset + 7] != 0,
-                            forward=values[entry_offset + 8] != 0,
+                            cycle=cycle,
+                            if_instruction=if_i,
+                            id_instruction=id_i,
+                            ex_instruction=ex_i,
+                            mem_instruction=mem_i,
+                            wb_instruction=wb_i,
+                            hazard_type=hazard,
+                            stall=stall != 0,
+                            forward=fwd != 0,
                         )
                     )
 
         # Check simulation complete
-        # Find pipeline_magic in the dump
-        for i in range(len(values) - 1, max(0, len(values) - 100), -1):
-            if values[i] == self.PIPELINE_MAGIC:
-                state.simulation_complete = True
-                break
+        # Find pipeline_magic near the end of the dump (one C-level scan,
+        # no slice copy for short dumps)
+        tail = values[-100:] if len(values) > 100 else values
+        state.simulation_complete = self.PIPELINE_MAGIC in tail
 
         return state
 
-    def _signed(self, value: int) -> int:
-        """Convert unsigned 32-bit to signed."""
-        if value > 0x7FFFFFFF:
-            return value - 0x100000000
-        return value
-
     def simulate(self, user_code: str, enable_forwarding: bool = True) -> PipelineState:
         """
         Simulate the pipeline for user MIPS code.
@@ -415,6 +507,14 @@ class PipelineSimulator:
         Returns:
             PipelineState with simulation results
         """
+        # A full run is deterministic in (code, forwarding), so serve
+        # repeats from cache. Copies keep cached state immutable.
+        state_key = (self._code_hash(user_code), enable_forwarding)
+        cached_state = self._state_cache.get(state_key)
+        if cached_state is not None:
+            self._state_cache.move_to_end(state_key)
+            return copy.deepcopy(cached_state)
+
         # Step 1: Assemble user code to get instruction words
         instructions = self._assemble_to_words(user_code)
 
@@ -426,7 +526,7 @@ class PipelineSimulator:
 
         # Step 3: Execute simulator in MARS
         with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".asm", delete=False, encoding="ascii", errors="ignore"
+            mode="wb", suffix=".asm", delete=False, dir=self._scratch
         ) as f:
             f.write(simulator_code)
             simulator_file = f.name
@@ -439,6 +539,7 @@ class PipelineSimulator:
             # The program must run to completion to populate memory with results
             cmd = [
                 "java",
+                *_JAVA_STARTUP_FLAGS,
                 "-jar",
                 str(self.mars_jar),
                 "nc",
@@ -466,6 +567,11 @@ class PipelineSimulator:
             # Step 4: Parse results from MIPS memory
             state = self._parse_simulation_output(memory_dump, len(instructions))
 
+            if state.simulation_complete:
+                self._state_cache[state_key] = copy.deepcopy(state)
+                if len(self._state_cache) > self.CACHE_MAXSIZE:
+                    self._state_cache.popitem(last=False)
+
             return state
 
         except subprocess.TimeoutExpired:
@@ -482,6 +588,38 @@ class PipelineSimulator:
             except OSError:
                 pass
 
+    def simulate_batch(
+        self, cases: list[tuple[str, bool]]
+    ) -> list[PipelineState]:
+        """
+        Simulate several (user_code, enable_forwarding) cases.
+
+        MARS executes one program per invocation, so the cases cannot
+        share a single run; instead duplicate cases are computed once and
+        each unique program is assembled only once via the caches, which
+        amortizes the JVM cost across the batch.
+
+        Args:
+            cases: List of (user_code, enable_forwarding) pairs
+
+        Returns:
+            PipelineState per case, aligned with the input order
+        """
+        seen: dict[tuple[str, bool], PipelineState] = {}
+        results: list[PipelineState] = []
+
+        for user_code, enable_forwarding in cases:
+            key = (self._code_hash(user_code), enable_forwarding)
+            state = seen.get(key)
+            if state is None:
+                state = self.simulate(user_code, enable_forwarding)
+                seen[key] = state
+                results.append(state)
+            else:
+                results.append(copy.deepcopy(state))
+
+        return results
+
 
 # Singleton instance
 _simulator: PipelineSimulator | None = None
@@ -10,8 +10,6 @@ Per the design document:
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from app.models.schemas import MIPS_REGISTERS, ExecutionState
 
 
@@ -28,7 +26,7 @@ class StateManager:
         """Initialize empty state manager."""
         self._states: list[ExecutionState] = []
         self._current_index: int = 0
-        self._initial_state: ExecutionState | None = None
+        self._changed: list[list[str]] = []
 
     def load_trace(self, states: list[ExecutionState]) -> None:
         """
@@ -42,8 +40,17 @@ class StateManager:
 
         self._states = states
         self._current_index = 0
-        # Store deep copy of initial state for reset
-        self._initial_state = deepcopy(states[0])
+
+        # The trace is immutable once loaded, so per-step register diffs are
+        # a pure function of it - compute them once here instead of walking
+        # all registers on every step() call
+        self._changed = [list(states[0].changed_registers)]
+        for prev, curr in zip(states, states[1:]):
+            self._changed.append(
+                self._detect_changed_registers(
+                    prev.registers.values, curr.registers.values
+                )
+            )
 
     def get_current_state(self) -> ExecutionState | None:
         """
@@ -69,33 +76,21 @@ class StateManager:
         if not self._states:
             return None
 
-        # Get previous state for change detection
-        prev_state = self._states[self._current_index]
-
-        # Advance index if not at end
+        # Advance index if not at end; the register diff for each step was
+        # precomputed at load time, so this is a list index. Stepping while
+        # already at the end re-serves the final state with no changes.
         if self._current_index < len(self._states) - 1:
             self._current_index += 1
+            changed_registers = self._changed[self._current_index]
+        else:
+            changed_registers = []
 
+        # The trace came from our own loader, so no validation or copy is
+        # needed - write the precomputed diff onto the stored state and
+        # return it directly
         current_state = self._states[self._current_index]
-
-        # Detect changed registers between previous and current state
-        changed_registers = self._detect_changed_registers(
-            prev_state.registers.values, current_state.registers.values
-        )
-
-        # Update the current state with changed registers
-        # Create a new state with updated changed_registers
-        updated_state = ExecutionState(
-            pc=current_state.pc,
-            current_instruction=current_state.current_instruction,
-            registers=current_state.registers,
-            changed_registers=changed_registers,
-            memory=current_state.memory,
-            heap=current_state.heap,
-            is_complete=current_state.is_complete,
-        )
-
-        return updated_state
+        current_state.changed_registers = changed_registers
+        return current_state
 
     def _detect_changed_registers(
         self,
@@ -112,15 +107,19 @@ class StateManager:
         Returns:
             List of register names that changed (never includes $zero)
         """
-        changed: list[str] = []
-        for reg in MIPS_REGISTERS:
-            if reg == "$zero":
-                continue  # $zero never changes
-            prev_val = prev_registers.get(reg, 0)
-            curr_val = curr_registers.get(reg, 0)
-            if prev_val != curr_val:
-                changed.append(reg)
-        return changed
+        # Identity first (consecutive trace states often share the dict),
+        # then dict equality - both skip the register walk entirely for
+        # the common no-change case
+        if prev_registers is curr_registers or prev_registers == curr_registers:
+            return []
+
+        prev_get = prev_registers.get
+        curr_get = curr_registers.get
+        return [
+            reg
+            for reg in MIPS_REGISTERS
+            if reg != "$zero" and prev_get(reg, 0) != curr_get(reg, 0)
+        ]
 
     def reset(self) -> ExecutionState | None:
         """
@@ -129,12 +128,15 @@ class StateManager:
         Returns:
             The initial state, or None if no trace loaded.
         """
-        if not self._states or self._initial_state is None:
+        if not self._states:
             return None
 
+        # step() only ever rewrites changed_registers on the state it
+        # serves; everything else in the trace is read-only after
+        # load_trace, so no snapshot restore is needed - just rewind the
+        # index and put back the initial diff list
         self._current_index = 0
-        # Restore initial state from snapshot
-        self._states[0] = deepcopy(self._initial_state)
+        self._states[0].changed_registers = self._changed[0]
         return self._states[0]
 
     def get_step_index(self) -> int:
@@ -179,7 +181,7 @@ class StateManager:
         """Clear all state and trace data."""
         self._states = []
         self._current_index = 0
-        self._initial_state = None
+        self._changed = []
 
 
 # Singleton instance for the application
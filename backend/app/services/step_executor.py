@@ -10,16 +10,74 @@ IMPORTANT: This provides REAL execution state from MARS, not simulated values.
 
 from __future__ import annotations
 
+import atexit
 import os
 import re
+import shutil
+import struct
 import subprocess
+import sys
 import tempfile
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+# JVM startup dominates every step-limited MARS run. Tier-1-only JIT and
+# a small serial-GC heap keep per-spawn init cost down; a CDS archive
+# (generated lazily, see __init__) cuts class loading further.
+_JAVA_BASE_FLAGS: list[str] = [
+    "-XX:+TieredCompilation",
+    "-XX:TieredStopAtLevel=1",
+    "-XX:+UseSerialGC",
+    "-Xmx128m",
+]
 
-@dataclass
+# Whether CDS archive generation has been attempted this process. It can
+# fail permanently (JRE < 10, read-only jar directory), and executors are
+# constructed per session, so without this flag every new session would
+# re-block on the doomed 10s generation run.
+_cds_generation_attempted: bool = False
+
+# Register dump line: "$t0     42" - compiled once, scanned with finditer.
+# Bytes pattern: MARS stdout is captured raw and parsed without a full
+# UTF-8 decode of the buffer.
+_REG_RE: re.Pattern[bytes] = re.compile(rb"\$(\w+)\s+(-?\d+)")
+
+# Bare integer line in MARS "ic" output - the executed-instruction count
+_IC_RE: re.Pattern[bytes] = re.compile(rb"^\s*(\d+)\s*$", re.MULTILINE)
+
+
+class RegisterFileView(Mapping):
+    """
+    Read-only dict-like view over one row of the shared register matrix.
+
+    The full trace stores all register values in a single contiguous
+    int32 array (one 32-word row per step) instead of a dict per step;
+    each view is just (matrix, row offset), so no per-step dict of 32
+    entries plus boxed ints is ever materialized.
+    """
+
+    __slots__ = ("_matrix", "_offset")
+
+    def __init__(self, matrix: array, offset: int) -> None:
+        self._matrix = matrix
+        self._offset = offset
+
+    def __getitem__(self, name: str) -> int:
+        return self._matrix[self._offset + StepExecutor.REGISTER_INDEX[name]]
+
+    def __iter__(self):
+        return iter(StepExecutor.REGISTER_NAMES)
+
+    def __len__(self) -> int:
+        return len(StepExecutor.REGISTER_NAMES)
+
+
+@dataclass(slots=True)
 class ExecutionStep:
     """Single step in MIPS execution."""
 
@@ -28,13 +86,16 @@ class ExecutionStep:
     pc_hex: str
     instruction: str
     instruction_hex: str
-    registers: dict[str, int]
+    registers: Mapping[str, int]
     changed_registers: list[str]
-    description: str
+    # Filled lazily on first read - only the step actually served to the
+    # client ever pays for formatting
+    description: str = ""
     is_complete: bool = False
+    changed_mask: int = 0  # Bit i set = REGISTER_NAMES[i] changed
 
 
-@dataclass
+@dataclass(slots=True)
 class StepExecutionState:
     """Complete state for step-by-step execution."""
 
@@ -92,6 +153,65 @@ class StepExecutor:
         "$ra",
     ]
 
+    # Interned so register-name dict lookups in the step loop hit the
+    # pointer-equality fast path
+    REGISTER_NAMES = [sys.intern(name) for name in REGISTER_NAMES]
+
+    # Register name -> bit position, for packing change sets into a mask
+    REGISTER_INDEX: dict[str, int] = {
+        name: i for i, name in enumerate(REGISTER_NAMES)
+    }
+
+    # Decode lookup tables, built once - the decoder runs per instruction
+    # at program load, and the table contents never change
+    FUNCT_NAMES: dict[int, str] = {
+        0x20: "add",
+        0x21: "addu",
+        0x22: "sub",
+        0x23: "subu",
+        0x24: "and",
+        0x25: "or",
+        0x26: "xor",
+        0x27: "nor",
+        0x2A: "slt",
+        0x2B: "sltu",
+        0x00: "sll",
+        0x02: "srl",
+        0x03: "sra",
+        0x08: "jr",
+        0x09: "jalr",
+        0x0C: "syscall",
+    }
+    OPCODE_NAMES: dict[int, str] = {
+        0x08: "addi",
+        0x09: "addiu",
+        0x0C: "andi",
+        0x0D: "ori",
+        0x0A: "slti",
+        0x0B: "sltiu",
+        0x0F: "lui",
+        0x23: "lw",
+        0x21: "lh",
+        0x20: "lb",
+        0x25: "lhu",
+        0x24: "lbu",
+        0x2B: "sw",
+        0x29: "sh",
+        0x28: "sb",
+        0x04: "beq",
+        0x05: "bne",
+        0x06: "blez",
+        0x07: "bgtz",
+    }
+    # Step-limited runs are independent of each other, so they execute in
+    # parallel batches of this many MARS processes at a time
+    MAX_PARALLEL_STEPS: int = 8
+
+    SHIFT_FUNCTS: frozenset[int] = frozenset({0x00, 0x02, 0x03})
+    MEMORY_OPCODES: frozenset[int] = frozenset(
+        {0x23, 0x21, 0x20, 0x25, 0x24, 0x2B, 0x29, 0x28}
+    )
+
     def __init__(self, mars_jar_path: str | None = None):
         """Initialize step executor."""
         if mars_jar_path:
@@ -103,8 +223,54 @@ class StepExecutor:
             raise FileNotFoundError(f"MARS jar not found at: {self.mars_jar}")
 
         self._state: StepExecutionState | None = None
+
+        # Shared register storage for the whole trace - one contiguous
+        # int32 word per register per step; ExecutionStep.registers are
+        # RegisterFileView rows into this
+        self._reg_matrix: array = array("i")
+
+        # Stable per-executor workdir: the program and its dump keep the
+        # same paths across all the step-limited runs, so the OS page cache
+        # stays warm, and the whole dir is removed in one rmtree
+        self._workdir: str = tempfile.mkdtemp(prefix="cavl_")
+        atexit.register(shutil.rmtree, self._workdir, ignore_errors=True)
         self._temp_file: str | None = None
 
+        # Best-effort class-data-sharing archive next to the jar. Generated
+        # once on first use (requires JDK 10+); every subsequent JVM spawn
+        # loads classes from the archive instead of scanning the jar.
+        global _cds_generation_attempted
+        self._cds_archive: Path | None = None
+        archive = self.mars_jar.parent / "mars.jsa"
+        if archive.exists():
+            self._cds_archive = archive
+        elif not _cds_generation_attempted:
+            _cds_generation_attempted = True
+            try:
+                subprocess.run(
+                    [
+                        "java",
+                        f"-XX:ArchiveClassesAtExit={archive}",
+                        "-jar",
+                        str(self.mars_jar),
+                        "nc",
+                    ],
+                    capture_output=True,
+                    timeout=10.0,
+                    cwd=str(self.mars_jar.parent),
+                )
+                if archive.exists():
+                    self._cds_archive = archive
+            except Exception:
+                pass
+
+    def _java_cmd(self) -> list[str]:
+        """Base java command with startup-tuning flags."""
+        cmd = ["java", *_JAVA_BASE_FLAGS]
+        if self._cds_archive is not None:
+            cmd += ["-Xshare:auto", f"-XX:SharedArchiveFile={self._cds_archive}"]
+        return cmd
+
     def load_program(self, code: str, max_steps: int = 200) -> StepExecutionState:
         """
         Load and execute MIPS program, capturing state at each step.
@@ -118,13 +284,16 @@ class StepExecutor:
         """
         self._state = StepExecutionState(code=code)
 
-        # Write code to temp file
+        # Fresh matrix per load: steps from the previous trace keep their
+        # views into the old array
+        self._reg_matrix = array("i")
+
+        # Write code to the stable program path inside the workdir
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".asm", delete=False, encoding="utf-8"
-            ) as f:
+            program_path = os.path.join(self._workdir, "program.asm")
+            with open(program_path, "w", encoding="utf-8") as f:
                 f.write(code)
-                self._temp_file = f.name
+            self._temp_file = program_path
         except Exception as e:
             self._state.error = f"Failed to write temp file: {e}"
             return self._state
@@ -145,58 +314,93 @@ class StepExecutor:
                     pc_hex="0x00400000",
                     instruction="(Initial State)",
                     instruction_hex="0x00000000",
-                    registers=initial_regs,
+                    registers=self._pack_registers(initial_regs),
                     changed_registers=[],
                     description="Program loaded, ready to execute",
                     is_complete=False,
                 )
             )
 
-            # Execute step by step
-            prev_regs = initial_regs.copy()
-            step_num = 1
-
-            while step_num <= min(len(instructions), max_steps):
-                # Execute with step limit
-                regs, success, output = self._execute_with_step_limit(step_num)
-
-                if not success:
-                    # Execution completed or error
-                    break
-
-                # Find changed registers
-                changed = self._find_changed_registers(prev_regs, regs)
-
-                # Get instruction info
-                instr_idx = step_num - 1
-                if instr_idx < len(instructions):
-                    pc, instr_hex, instr_text = instructions[instr_idx]
-                else:
-                    pc = 0x00400000 + (step_num - 1) * 4
-                    instr_hex = "0x00000000"
-                    instr_text = "(unknown)"
-
-                # Create step record
-                step = ExecutionStep(
-                    step_number=step_num,
-                    pc=pc,
-                    pc_hex=f"0x{pc:08X}",
-                    instruction=instr_text,
-                    instruction_hex=instr_hex,
-                    registers=regs,
-                    changed_registers=changed,
-                    description=self._generate_description(instr_text, changed, regs),
-                    is_complete=False,
-                )
-                self._state.steps.append(step)
-
-                prev_regs = regs.copy()
-                step_num += 1
+            # One run with MARS's instruction-count flag tells us exactly
+            # how many steps the program executes, so the step-limited runs
+            # below cover loops correctly (dynamic count > static listing)
+            # and never probe past the program's end
+            executed = self._count_executed_instructions(max_steps)
+            if executed:
+                total_steps = min(executed, max_steps)
+            else:
+                total_steps = min(len(instructions), max_steps)
 
-                # Check if program completed (syscall 10)
-                if "syscall" in instr_text.lower() and regs.get("$v0", 0) == 10:
-                    step.is_complete = True
-                    break
+            # Execute step by step. Each step-limited MARS run is independent
+            # of the others, so batches of them run concurrently - the cost
+            # per step is JVM startup, not MIPS semantics, and this divides
+            # the wall time by the batch width.
+            prev_regs = initial_regs
+            step_num = 1
+            stop = False
+
+            with ThreadPoolExecutor(
+                max_workers=self.MAX_PARALLEL_STEPS
+            ) as pool:
+                while step_num <= total_steps and not stop:
+                    batch = range(
+                        step_num,
+                        min(step_num + self.MAX_PARALLEL_STEPS, total_steps + 1),
+                    )
+                    results = list(
+                        pool.map(self._execute_with_step_limit, batch)
+                    )
+                    step_num = batch.stop
+
+                    for current, (regs, success, _output) in zip(batch, results):
+                        if not success:
+                            # Execution completed or error
+                            stop = True
+                            break
+
+                        # Find changed registers; the packed mask encodes the
+                        # same set in one int (changed lists are short, so
+                        # packing is a couple of shifts)
+                        changed = self._find_changed_registers(prev_regs, regs)
+                        mask = 0
+                        for name in changed:
+                            mask |= 1 << self.REGISTER_INDEX[name]
+
+                        # Get instruction info
+                        instr_idx = current - 1
+                        if instr_idx < len(instructions):
+                            pc, instr_hex, instr_text = instructions[instr_idx]
+                        else:
+                            pc = 0x00400000 + (current - 1) * 4
+                            instr_hex = "0x00000000"
+                            instr_text = "(unknown)"
+
+                        # Create step record
+                        step = ExecutionStep(
+                            step_number=current,
+                            pc=pc,
+                            pc_hex=f"0x{pc:08X}",
+                            instruction=instr_text,
+                            instruction_hex=instr_hex,
+                            registers=self._pack_registers(regs),
+                            changed_registers=changed,
+                            is_complete=False,
+                            changed_mask=mask,
+                        )
+                        self._state.steps.append(step)
+
+                        # regs is a fresh dict from _parse_register_dump and
+                        # is never mutated afterwards - alias it, no copy
+                        prev_regs = regs
+
+                        # Check if program completed (syscall 10)
+                        if (
+                            "syscall" in instr_text.lower()
+                            and regs.get("$v0", 0) == 10
+                        ):
+                            step.is_complete = True
+                            stop = True
+                            break
 
             # Mark last step as complete
             if self._state.steps:
@@ -208,15 +412,9 @@ class StepExecutor:
 
         except Exception as e:
             self._state.error = f"Execution error: {str(e)}"
-        finally:
-            # Clean up temp file
-            if self._temp_file:
-                try:
-                    os.unlink(self._temp_file)
-                except OSError:
-                    pass
-                self._temp_file = None
 
+        # The program file stays in the workdir (overwritten by the next
+        # load); the whole dir is cleaned up at exit
         return self._state
 
     def _get_instruction_list(self) -> list[tuple[int, str, str]]:
@@ -230,10 +428,16 @@ class StepExecutor:
             return []
 
         try:
-            # Use MARS to dump text segment
+            # Use MARS to dump text segment. Drop any dump left from a
+            # previous program at the stable path so a failed assembly
+            # can't read stale instructions.
             dump_file = self._temp_file + ".text"
+            try:
+                os.unlink(dump_file)
+            except OSError:
+                pass
             cmd = [
-                "java",
+                *self._java_cmd(),
                 "-jar",
                 str(self.mars_jar),
                 "nc",
@@ -255,23 +459,89 @@ class StepExecutor:
 
             instructions: list[tuple[int, str, str]] = []
             if os.path.exists(dump_file):
-                with open(dump_file, "r") as f:
+                with open(dump_file, "rb") as f:
+                    raw = f.read()
+
+                lines = raw.decode("ascii", errors="ignore").split()
+                decode = self._decode_instruction_simple
+
+                # HexText is fixed 8-hex-digit words - decode them all in
+                # one fromhex/unpack pass instead of int(line, 16) per line
+                try:
+                    buf = bytes.fromhex("".join(line.zfill(8) for line in lines))
+                    words = struct.unpack(f">{len(lines)}I", buf)
+                except (ValueError, struct.error):
+                    words = None
+
+                if words is not None:
+                    instructions = [
+                        (0x00400000 + i * 4, f"0x{word:08X}", decode(word))
+                        for i, word in enumerate(words)
+                    ]
+                else:
                     pc = 0x00400000
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            hex_val = f"0x{line.upper()}"
-                            # Decode instruction (simplified)
-                            instr_text = self._decode_instruction_simple(int(line, 16))
-                            instructions.append((pc, hex_val, instr_text))
-                            pc += 4
-                os.unlink(dump_file)
+                    for line in lines:
+                        try:
+                            word = int(line, 16)
+                        except ValueError:
+                            continue
+                        instructions.append((pc, f"0x{word:08X}", decode(word)))
+                        pc += 4
 
             return instructions
 
         except Exception:
             return []
 
+    def _count_executed_instructions(self, max_steps: int) -> int | None:
+        """
+        Run the program once with MARS's ic flag to learn its dynamic
+        instruction count.
+
+        MARS has no per-step trace output, but a single full run with the
+        instruction-count option reports how many instructions actually
+        executed - one JVM spawn that sizes the whole capture loop.
+
+        Args:
+            max_steps: Step limit for the counting run
+
+        Returns:
+            Number of executed instructions, or None if it could not be
+            determined (the caller falls back to the static listing)
+        """
+        if not self._temp_file:
+            return None
+
+        cmd = [
+            *self._java_cmd(),
+            "-jar",
+            str(self.mars_jar),
+            "nc",
+            "ic",  # Print executed-instruction count after the run
+            str(max_steps),
+            self._temp_file,
+        ]
+
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=str(self.mars_jar.parent),
+            )
+            stdout, _ = proc.communicate(timeout=5.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return None
+        except Exception:
+            return None
+
+        # The count is the last bare integer line; program output comes
+        # before it, so scan from the end
+        matches = _IC_RE.findall(stdout)
+        return int(matches[-1]) if matches else None
+
     def _execute_with_step_limit(self, steps: int) -> tuple[dict[str, int], bool, str]:
         """
         Execute program with a specific step limit.
@@ -287,7 +557,7 @@ class StepExecutor:
 
         try:
             cmd = [
-                "java",
+                *self._java_cmd(),
                 "-jar",
                 str(self.mars_jar),
                 "nc",  # No copyright
@@ -296,40 +566,52 @@ class StepExecutor:
                 self._temp_file,
             ]
 
-            result = subprocess.run(
+            # Popen + read() drains the pipe directly instead of
+            # capture_output's extra buffering layer; stderr is dropped at
+            # the OS level rather than collected and thrown away
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=5.0,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 cwd=str(self.mars_jar.parent),
             )
+            try:
+                stdout, _ = proc.communicate(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                return {}, False, "Timeout"
 
-            # Parse register values from output
-            registers = self._parse_register_dump(result.stdout)
+            # Parse register values from the raw bytes - no full decode
+            registers = self._parse_register_dump(stdout)
 
             # Check if execution actually happened
-            success = bool(registers) and "Error" not in result.stdout
+            success = bool(registers) and b"Error" not in stdout
 
-            return registers, success, result.stdout
+            # Only materialize the output as text when something went wrong
+            output = "" if success else stdout.decode("utf-8", "replace")
+            return registers, success, output
 
         except subprocess.TimeoutExpired:
             return {}, False, "Timeout"
         except Exception as e:
             return {}, False, str(e)
 
-    def _parse_register_dump(self, output: str) -> dict[str, int]:
-        """Parse register values from MARS output."""
-        registers: dict[str, int] = {}
-        pattern = re.compile(r"\$(\w+)\s+(-?\d+)")
-
-        for line in output.split("\n"):
-            match = pattern.search(line)
-            if match:
-                reg_name = f"${match.group(1)}"
-                value = int(match.group(2))
-                registers[reg_name] = value
-
-        return registers
+    def _parse_register_dump(self, output: bytes) -> dict[str, int]:
+        """Parse register values from raw MARS output."""
+        # One finditer pass over the whole buffer - the pattern anchors on
+        # "$", so no per-line split (a full copy of the output) is needed
+        return {
+            sys.intern(f"${m.group(1).decode('ascii')}"): int(m.group(2))
+            for m in _REG_RE.finditer(output)
+        }
+
+    def _pack_registers(self, regs: dict[str, int]) -> RegisterFileView:
+        """Append one 32-word row to the register matrix, return its view."""
+        offset = len(self._reg_matrix)
+        get = regs.get
+        self._reg_matrix.extend(get(name, 0) for name in self.REGISTER_NAMES)
+        return RegisterFileView(self._reg_matrix, offset)
 
     def _get_initial_registers(self) -> dict[str, int]:
         """Get initial register values (all zeros except $sp, $gp)."""
@@ -342,13 +624,18 @@ class StepExecutor:
         self, prev: dict[str, int], curr: dict[str, int]
     ) -> list[str]:
         """Find which registers changed between steps."""
-        changed = []
-        for name in self.REGISTER_NAMES:
-            prev_val = prev.get(name, 0)
-            curr_val = curr.get(name, 0)
-            if prev_val != curr_val:
-                changed.append(name)
-        return changed
+        # Identity first (steps can alias the same dict), then equality -
+        # both skip the register walk entirely when nothing changed
+        if prev is curr or prev == curr:
+            return []
+
+        prev_get = prev.get
+        curr_get = curr.get
+        return [
+            name
+            for name in self.REGISTER_NAMES
+            if prev_get(name, 0) != curr_get(name, 0)
+        ]
 
     def _decode_instruction_simple(self, word: int) -> str:
         """Simple instruction decoding for display."""
@@ -357,92 +644,26 @@ class StepExecutor:
 
         opcode = (word >> 26) & 0x3F
 
-        # R-type
+        # Every known opcode/funct dispatches through a closure specialized
+        # to its operand layout at import time - one dict lookup replaces
+        # the old branch cascade. R-type instructions key on (0, funct).
+        key = (0, word & 0x3F) if opcode == 0 else opcode
+        decoder = _INSTRUCTION_DECODERS.get(key)
+        if decoder is not None:
+            return decoder(word)
+
+        # Unknown encodings keep the generic placeholder forms
         if opcode == 0:
             funct = word & 0x3F
-            rs = (word >> 21) & 0x1F
-            rt = (word >> 16) & 0x1F
-            rd = (word >> 11) & 0x1F
-            shamt = (word >> 6) & 0x1F
-
-            funct_names = {
-                0x20: "add",
-                0x21: "addu",
-                0x22: "sub",
-                0x23: "subu",
-                0x24: "and",
-                0x25: "or",
-                0x26: "xor",
-                0x27: "nor",
-                0x2A: "slt",
-                0x2B: "sltu",
-                0x00: "sll",
-                0x02: "srl",
-                0x03: "sra",
-                0x08: "jr",
-                0x09: "jalr",
-                0x0C: "syscall",
-            }
-
-            name = funct_names.get(funct, f"r-type(0x{funct:02X})")
-
-            if funct == 0x0C:
-                return "syscall"
-            elif funct == 0x08:
-                return f"jr {self._reg_name(rs)}"
-            elif funct in [0x00, 0x02, 0x03]:
-                return f"{name} {self._reg_name(rd)}, {self._reg_name(rt)}, {shamt}"
-            else:
-                return f"{name} {self._reg_name(rd)}, {self._reg_name(rs)}, {self._reg_name(rt)}"
-
-        # J-type
-        elif opcode == 2:
-            return f"j 0x{(word & 0x3FFFFFF) << 2:08X}"
-        elif opcode == 3:
-            return f"jal 0x{(word & 0x3FFFFFF) << 2:08X}"
-
-        # I-type
-        else:
-            rs = (word >> 21) & 0x1F
-            rt = (word >> 16) & 0x1F
-            imm = word & 0xFFFF
-            if imm & 0x8000:  # Sign extend
-                imm -= 0x10000
-
-            opcode_names = {
-                0x08: "addi",
-                0x09: "addiu",
-                0x0C: "andi",
-                0x0D: "ori",
-                0x0A: "slti",
-                0x0B: "sltiu",
-                0x0F: "lui",
-                0x23: "lw",
-                0x21: "lh",
-                0x20: "lb",
-                0x25: "lhu",
-                0x24: "lbu",
-                0x2B: "sw",
-                0x29: "sh",
-                0x28: "sb",
-                0x04: "beq",
-                0x05: "bne",
-                0x06: "blez",
-                0x07: "bgtz",
-            }
-
-            name = opcode_names.get(opcode, f"i-type(0x{opcode:02X})")
-
-            if opcode == 0x0F:  # lui
-                return f"lui {self._reg_name(rt)}, {imm & 0xFFFF}"
-            elif opcode in [0x23, 0x21, 0x20, 0x25, 0x24, 0x2B, 0x29, 0x28]:
-                return f"{name} {self._reg_name(rt)}, {imm}({self._reg_name(rs)})"
-            elif opcode in [0x04, 0x05]:
-                return f"{name} {self._reg_name(rs)}, {self._reg_name(rt)}, {imm}"
-            elif opcode in [0x06, 0x07]:
-                return f"{name} {self._reg_name(rs)}, {imm}"
-            else:
-                return f"{name} {self._reg_name(rt)}, {self._reg_name(rs)}, {imm}"
+            return (
+                f"r-type(0x{funct:02X}) {self._reg_name((word >> 11) & 0x1F)}, "
+                f"{self._reg_name((word >> 21) & 0x1F)}, "
+                f"{self._reg_name((word >> 16) & 0x1F)}"
+            )
+        return (
+            f"i-type(0x{opcode:02X}) {self._reg_name((word >> 16) & 0x1F)}, "
+            f"{self._reg_name((word >> 21) & 0x1F)}, {_sign16(word)}"
+        )
 
     def _reg_name(self, num: int) -> str:
         """Get register name from number."""
@@ -451,7 +672,7 @@ class StepExecutor:
         return f"${num}"
 
     def _generate_description(
-        self, instruction: str, changed: list[str], regs: dict[str, int]
+        self, instruction: str, changed: list[str], regs: Mapping[str, int]
     ) -> str:
         """Generate human-readable description of what happened."""
         if not changed:
@@ -471,8 +692,14 @@ class StepExecutor:
         if not self._state or not self._state.steps:
             return None
         if self._state.current_step >= len(self._state.steps):
-            return self._state.steps[-1]
-        return self._state.steps[self._state.current_step]
+            step = self._state.steps[-1]
+        else:
+            step = self._state.steps[self._state.current_step]
+        if not step.description:
+            step.description = self._generate_description(
+                step.instruction, step.changed_registers, step.registers
+            )
+        return step
 
     def step_forward(self) -> ExecutionStep | None:
         """Move to next step."""
@@ -518,21 +745,114 @@ class StepExecutor:
         """Get all execution steps."""
         if not self._state:
             return []
+        for step in self._state.steps:
+            if not step.description:
+                step.description = self._generate_description(
+                    step.instruction, step.changed_registers, step.registers
+                )
         return self._state.steps
 
 
-# Session-based storage for step executors
-_executors: dict[str, StepExecutor] = {}
+def _sign16(word: int) -> int:
+    """Sign-extend the low 16 bits of an instruction word."""
+    imm = word & 0xFFFF
+    return imm - 0x10000 if imm & 0x8000 else imm
+
+
+def _build_instruction_decoders() -> dict[int | tuple[int, int], Callable[[int], str]]:
+    """
+    Build the instruction-decode dispatch table.
+
+    For a fixed ISA every instruction's display format is a constant, so
+    each entry is a closure bound to its mnemonic and operand layout.
+    Keys are the opcode, or (0, funct) for R-type.
+    """
+    regs = StepExecutor.REGISTER_NAMES
+    decoders: dict[int | tuple[int, int], Callable[[int], str]] = {}
+
+    def r3(name: str) -> Callable[[int], str]:
+        return lambda w: (
+            f"{name} {regs[(w >> 11) & 0x1F]}, "
+            f"{regs[(w >> 21) & 0x1F]}, {regs[(w >> 16) & 0x1F]}"
+        )
+
+    def shift(name: str) -> Callable[[int], str]:
+        return lambda w: (
+            f"{name} {regs[(w >> 11) & 0x1F]}, "
+            f"{regs[(w >> 16) & 0x1F]}, {(w >> 6) & 0x1F}"
+        )
+
+    def memory(name: str) -> Callable[[int], str]:
+        return lambda w: (
+            f"{name} {regs[(w >> 16) & 0x1F]}, {_sign16(w)}({regs[(w >> 21) & 0x1F]})"
+        )
+
+    def branch2(name: str) -> Callable[[int], str]:
+        return lambda w: (
+            f"{name} {regs[(w >> 21) & 0x1F]}, {regs[(w >> 16) & 0x1F]}, {_sign16(w)}"
+        )
+
+    def branch1(name: str) -> Callable[[int], str]:
+        return lambda w: f"{name} {regs[(w >> 21) & 0x1F]}, {_sign16(w)}"
+
+    def imm_arith(name: str) -> Callable[[int], str]:
+        return lambda w: (
+            f"{name} {regs[(w >> 16) & 0x1F]}, {regs[(w >> 21) & 0x1F]}, {_sign16(w)}"
+        )
+
+    for funct, name in StepExecutor.FUNCT_NAMES.items():
+        if funct == 0x0C:
+            decoders[(0, funct)] = lambda w: "syscall"
+        elif funct == 0x08:
+            decoders[(0, funct)] = lambda w: f"jr {regs[(w >> 21) & 0x1F]}"
+        elif funct in StepExecutor.SHIFT_FUNCTS:
+            decoders[(0, funct)] = shift(name)
+        else:
+            decoders[(0, funct)] = r3(name)
+
+    decoders[0x02] = lambda w: f"j 0x{(w & 0x3FFFFFF) << 2:08X}"
+    decoders[0x03] = lambda w: f"jal 0x{(w & 0x3FFFFFF) << 2:08X}"
+
+    for opcode, name in StepExecutor.OPCODE_NAMES.items():
+        if opcode == 0x0F:  # lui takes the raw 16-bit immediate
+            decoders[opcode] = lambda w: f"lui {regs[(w >> 16) & 0x1F]}, {w & 0xFFFF}"
+        elif opcode in StepExecutor.MEMORY_OPCODES:
+            decoders[opcode] = memory(name)
+        elif opcode in (0x04, 0x05):
+            decoders[opcode] = branch2(name)
+        elif opcode in (0x06, 0x07):
+            decoders[opcode] = branch1(name)
+        else:
+            decoders[opcode] = imm_arith(name)
+
+    return decoders
+
+
+_INSTRUCTION_DECODERS = _build_instruction_decoders()
+
+
+# Session-based storage for step executors. Each executor holds a full
+# step trace plus a workdir on disk, so the store is bounded as an LRU:
+# recently used sessions stay, the oldest one is torn down when full.
+_executors: OrderedDict[str, StepExecutor] = OrderedDict()
+MAX_SESSIONS: int = 128
 
 
 def get_step_executor(session_id: str = "default") -> StepExecutor:
     """Get or create step executor for a session."""
-    if session_id not in _executors:
-        _executors[session_id] = StepExecutor()
-    return _executors[session_id]
+    executor = _executors.get(session_id)
+    if executor is None:
+        if len(_executors) >= MAX_SESSIONS:
+            _, evicted = _executors.popitem(last=False)
+            shutil.rmtree(evicted._workdir, ignore_errors=True)
+        executor = _executors[session_id] = StepExecutor()
+    else:
+        _executors.move_to_end(session_id)
+    return executor
 
 
 def reset_step_executor(session_id: str = "default") -> None:
     """Reset step executor for a session."""
-    if session_id in _executors:
-        del _executors[session_id]
+    executor = _executors.pop(session_id, None)
+    if executor is not None:
+        shutil.rmtree(executor._workdir, ignore_errors=True)
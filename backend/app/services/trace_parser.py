@@ -6,7 +6,11 @@ Parses MARS simulator output into structured data.
 from __future__ import annotations
 
 import re
+import struct
+import sys
+from array import array
 from dataclasses import dataclass
+from typing import IO
 
 from app.models.schemas import (
     MIPS_REGISTERS,
@@ -18,6 +22,12 @@ from app.models.schemas import (
     MemoryState,
     RegisterState,
 )
+from app.services.output_parser import MemoryBlockArray
+
+# Serialization constants: canonical register ordering and the pre-built
+# "$name\t" line prefixes used by serialize_registers
+_CANONICAL_ORDER: tuple[str, ...] = tuple(MIPS_REGISTERS)
+_REG_PREFIXES: tuple[str, ...] = tuple(f"{reg}\t" for reg in MIPS_REGISTERS)
 
 
 @dataclass
@@ -41,17 +51,41 @@ class TraceParser:
     - Instruction trace: 0x00400000: addi $t0, $zero, 5
     """
 
-    # Regex patterns for parsing
-    REGISTER_PATTERN: re.Pattern[str] = re.compile(r"\$(\w+)\s+(-?\d+)")
-    MEMORY_HEX_PATTERN: re.Pattern[str] = re.compile(r"0x([0-9a-fA-F]+)")
+    # Regex patterns for parsing. Both dump parsers scan the whole output
+    # with one finditer pass instead of splitting into lines, so the
+    # memory pattern anchors each value to the start of its line.
+    # The register pattern is fully line-anchored so a whole-buffer
+    # finditer can never pair a name with a value from the next line.
+    REGISTER_PATTERN: re.Pattern[str] = re.compile(
+        r"^[^\S\n]*\$(\w+)[^\S\n]+(-?\d+)[^\S\n]*$", re.MULTILINE
+    )
+    MEMORY_HEX_PATTERN: re.Pattern[str] = re.compile(
+        r"^[ \t]*0x([0-9a-fA-F]+)", re.MULTILINE
+    )
     INSTRUCTION_PATTERN: re.Pattern[str] = re.compile(r"0x([0-9a-fA-F]+):\s+(.+)")
 
+    # Register name -> canonical position, for positional state building
+    REG_INDEX: dict[str, int] = {reg: i for i, reg in enumerate(MIPS_REGISTERS)}
+
     # MIPS memory layout constants (default MARS configuration)
     TEXT_START: int = 0x00400000
     DATA_START: int = 0x10010000
     HEAP_START: int = 0x10040000  # Approximate, grows upward
     STACK_START: int = 0x7FFFEFFC  # Grows downward
 
+    def __init__(self):
+        """Initialize trace parser."""
+        # Shared empty-memory template: create_memory_state is usually
+        # called with no blocks at all (every step via
+        # create_execution_state), and nothing mutates a MemoryState after
+        # creation, so one instance serves all those calls
+        self._empty_memory_state: MemoryState = self._build_memory_state()
+
+        # Same idea for the empty heap: the per-step default in
+        # create_execution_state reuses this instead of constructing a
+        # fresh HeapState each call
+        self._empty_heap_state: HeapState = self.create_initial_heap_state()
+
     def parse_register_dump(self, output: str) -> dict[str, int]:
         """
         Parse register dump from MARS output.
@@ -59,17 +93,78 @@ class TraceParser:
         Args:
             output: MARS stdout containing register values
 
+        Returns:
+            Dictionary mapping register names to values
+        """
+        # One finditer pass over the whole buffer - register entries are
+        # line-distinct in MARS output, so no per-line splitting is needed.
+        # Keys are interned so they are the same objects as the canonical
+        # MIPS_REGISTERS names and later dict probes compare by pointer.
+        return {
+            sys.intern(f"${m.group(1)}"): int(m.group(2))
+            for m in self.REGISTER_PATTERN.finditer(output)
+        }
+
+    def parse_registers_to_state(self, output: str) -> RegisterState:
+        """
+        Parse a register dump straight into a complete RegisterState.
+
+        Fuses parse_register_dump and create_register_state: matches are
+        scattered into a positional slot list as they stream out of the
+        regex, then zipped into canonical order once - no intermediate
+        dict and no second pass over the names.
+
+        Args:
+            output: MARS stdout containing register values
+
+        Returns:
+            Complete RegisterState with all 32 registers
+        """
+        slots = [0] * len(MIPS_REGISTERS)
+        index_get = self.REG_INDEX.get
+        for m in self.REGISTER_PATTERN.finditer(output):
+            i = index_get(f"${m.group(1)}")
+            if i is not None:
+                slots[i] = int(m.group(2))
+        slots[0] = 0  # $zero is always 0
+        return RegisterState.model_construct(values=dict(zip(MIPS_REGISTERS, slots)))
+
+    def parse_register_dump_stream(
+        self, stream: IO[str], chunk_size: int = 1 << 16
+    ) -> dict[str, int]:
+        """
+        Parse register values from a text stream without buffering it all.
+
+        Scans fixed-size chunks and carries the trailing partial line over
+        to the next chunk, so peak memory stays one chunk's worth however
+        large the trace is. Lets a runner feed MARS stdout directly.
+
+        Args:
+            stream: Text stream containing register values
+            chunk_size: Bytes read per chunk
+
         Returns:
             Dictionary mapping register names to values
         """
         registers: dict[str, int] = {}
+        finditer = self.REGISTER_PATTERN.finditer
+        tail = ""
+
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            buf = tail + chunk
+            cut = buf.rfind("\n")
+            if cut == -1:
+                tail = buf
+                continue
+            for m in finditer(buf[:cut]):
+                registers[sys.intern(f"${m.group(1)}")] = int(m.group(2))
+            tail = buf[cut + 1 :]
 
-        for line in output.strip().split("\n"):
-            match = self.REGISTER_PATTERN.search(line)
-            if match:
-                reg_name = f"${match.group(1)}"
-                value = int(match.group(2))
-                registers[reg_name] = value
+        for m in finditer(tail):
+            registers[sys.intern(f"${m.group(1)}")] = int(m.group(2))
 
         return registers
 
@@ -90,27 +185,73 @@ class TraceParser:
         Returns:
             List of MemoryBlock objects
         """
-        blocks: list[MemoryBlock] = []
-        address = start_address
+        # The multiline pattern anchors each word to its own line, so one
+        # findall pass replaces the split/strip/match-per-line loop. The
+        # regex constrains every value to hex digits, so model_construct
+        # can skip pydantic validation on the trusted fields.
+        hexes = self.MEMORY_HEX_PATTERN.findall(output)
+        if not hexes:
+            return []
+
+        try:
+            # Decode every word with one bytes.fromhex call instead of a
+            # general-purpose int(h, 16) per word
+            buf = bytes.fromhex("".join(h.zfill(8) for h in hexes))
+            values: tuple[int, ...] | list[int] = struct.unpack(
+                f">{len(hexes)}I", buf
+            )
+        except (ValueError, struct.error):
+            # Oversized or odd-length values: parse one at a time
+            values = [int(h, 16) for h in hexes]
+
+        return [
+            MemoryBlock.model_construct(
+                address=start_address + i * word_size,
+                size=word_size,
+                value=v,
+            )
+            for i, v in enumerate(values)
+        ]
+
+    def parse_memory_dump_fast(
+        self,
+        output: str,
+        start_address: int,
+        word_size: int = 4,
+    ) -> MemoryBlockArray:
+        """
+        Parse memory dump into a compact word array.
 
-        for line in output.strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
+        For large heap/data dumps the per-word MemoryBlock construction in
+        parse_memory_dump dominates; this variant decodes all words in one
+        bytes.fromhex call into a MemoryBlockArray (one uint32 per word),
+        which still yields MemoryBlock objects on iteration/indexing for
+        callers that need the old shape.
 
-            match = self.MEMORY_HEX_PATTERN.match(line)
-            if match:
-                value = int(match.group(1), 16)
-                blocks.append(
-                    MemoryBlock(
-                        address=address,
-                        size=word_size,
-                        value=value,
-                    )
-                )
-                address += word_size
+        Args:
+            output: Memory dump content (one hex value per line)
+            start_address: Starting address of the dump
+            word_size: Size of each memory word in bytes
 
-        return blocks
+        Returns:
+            MemoryBlockArray holding one word value per dump line
+        """
+        hexes = self.MEMORY_HEX_PATTERN.findall(output)
+        if not hexes:
+            return MemoryBlockArray(start_address, array("I"), word_size)
+
+        try:
+            # Bulk path: the C hex decoder converts every word in one call
+            buf = bytes.fromhex("".join(h.zfill(8) for h in hexes))
+            values = array("I", struct.unpack(f">{len(hexes)}I", buf))
+        except (ValueError, struct.error):
+            # Oversized or odd-length values: decode one at a time
+            values = array("I")
+            append = values.append
+            for h in hexes:
+                append(int(h, 16) & 0xFFFFFFFF)
+
+        return MemoryBlockArray(start_address, values, word_size)
 
     def create_register_state(self, registers: dict[str, int]) -> RegisterState:
         """
@@ -124,14 +265,19 @@ class TraceParser:
         Returns:
             Complete RegisterState with all 32 registers
         """
-        values: dict[str, int] = {}
-        for reg in MIPS_REGISTERS:
-            if reg == "$zero":
-                values[reg] = 0  # $zero is always 0
-            else:
-                values[reg] = registers.get(reg, 0)
-
-        return RegisterState(values=values)
+        # Probe only the registers the caller actually supplied (usually
+        # fewer than 32 during partial traces): scatter them into a
+        # positional slot list, then zip back into canonical order. The
+        # values are parser-produced ints, so model_construct skips the
+        # pydantic validation pass.
+        slots = [0] * len(MIPS_REGISTERS)
+        index_get = self.REG_INDEX.get
+        for reg, value in registers.items():
+            i = index_get(reg)
+            if i is not None:
+                slots[i] = value
+        slots[0] = 0  # $zero is always 0
+        return RegisterState.model_construct(values=dict(zip(MIPS_REGISTERS, slots)))
 
     def create_memory_state(
         self,
@@ -152,42 +298,98 @@ class TraceParser:
         Returns:
             Complete MemoryState
         """
+        if not (text_blocks or data_blocks or heap_blocks or stack_blocks):
+            return self._empty_memory_state
+
+        return self._build_memory_state(
+            text_blocks, data_blocks, heap_blocks, stack_blocks
+        )
+
+    def _build_memory_state(
+        self,
+        text_blocks: list[MemoryBlock] | None = None,
+        data_blocks: list[MemoryBlock] | None = None,
+        heap_blocks: list[MemoryBlock] | None = None,
+        stack_blocks: list[MemoryBlock] | None = None,
+    ) -> MemoryState:
+        """Construct a MemoryState from the given block lists."""
         text_blocks_list = text_blocks or []
         data_blocks_list = data_blocks or []
         heap_blocks_list = heap_blocks or []
         stack_blocks_list = stack_blocks or []
 
-        def calc_end(blocks: list[MemoryBlock], start: int) -> int:
-            if not blocks:
-                return start
-            return max(b.address + b.size for b in blocks)
+        calc_end = self._segment_end
 
-        return MemoryState(
-            text=MemorySegment(
+        # Segment bounds and block lists are produced in-module, so skip
+        # the pydantic validation pass on construction
+        return MemoryState.model_construct(
+            text=MemorySegment.model_construct(
                 start_address=self.TEXT_START,
                 end_address=calc_end(text_blocks_list, self.TEXT_START),
                 blocks=text_blocks_list,
             ),
-            data=MemorySegment(
+            data=MemorySegment.model_construct(
                 start_address=self.DATA_START,
                 end_address=calc_end(data_blocks_list, self.DATA_START),
                 blocks=data_blocks_list,
             ),
-            heap=MemorySegment(
+            heap=MemorySegment.model_construct(
                 start_address=self.HEAP_START,
                 end_address=calc_end(heap_blocks_list, self.HEAP_START),
                 blocks=heap_blocks_list,
             ),
-            stack=MemorySegment(
+            stack=MemorySegment.model_construct(
                 start_address=self.STACK_START - 1024,  # Stack grows down
                 end_address=self.STACK_START,
                 blocks=stack_blocks_list,
             ),
         )
 
+    @staticmethod
+    def _segment_end(blocks: list[MemoryBlock], start: int) -> int:
+        """End address of a segment holding the given blocks."""
+        # One C-level pass; correct whatever order the blocks arrive in
+        return max((b.address + b.size for b in blocks), default=start)
+
+    def update_memory_state(
+        self,
+        prev: MemoryState,
+        segment_name: str,
+        blocks: list[MemoryBlock],
+    ) -> MemoryState:
+        """
+        Replace one segment of an existing MemoryState.
+
+        Steps usually touch a single segment, so rebuilding all four
+        MemorySegment models per step is wasted allocation; this builds
+        just the changed segment and shares the other three with prev.
+
+        Args:
+            prev: Memory state from the previous step
+            segment_name: One of "text", "data", "heap", "stack"
+            blocks: New block list for that segment
+
+        Returns:
+            MemoryState sharing all unchanged segments with prev
+        """
+        if segment_name == "stack":
+            segment = MemorySegment.model_construct(
+                start_address=self.STACK_START - 1024,  # Stack grows down
+                end_address=self.STACK_START,
+                blocks=blocks,
+            )
+        else:
+            start = getattr(self, f"{segment_name.upper()}_START")
+            segment = MemorySegment.model_construct(
+                start_address=start,
+                end_address=self._segment_end(blocks, start),
+                blocks=blocks,
+            )
+        return prev.with_updated(segment_name, segment)
+
     def create_initial_heap_state(self) -> HeapState:
         """Create an empty initial heap state."""
-        return HeapState(
+        return HeapState.model_construct(
             blocks=[],
             free_list=[],
             fragmentation=0.0,
@@ -208,15 +410,19 @@ class TraceParser:
         Returns:
             List of register names that changed (never includes $zero)
         """
-        changed: list[str] = []
-        for reg in MIPS_REGISTERS:
-            if reg == "$zero":
-                continue  # $zero never changes
-            prev_val = prev_registers.get(reg, 0)
-            curr_val = curr_registers.get(reg, 0)
-            if prev_val != curr_val:
-                changed.append(reg)
-        return changed
+        # Identity first (callers often pass the same dict twice), then
+        # dict equality - both skip the register walk entirely for the
+        # common no-change case
+        if prev_registers is curr_registers or prev_registers == curr_registers:
+            return []
+
+        prev_get = prev_registers.get
+        curr_get = curr_registers.get
+        return [
+            reg
+            for reg in MIPS_REGISTERS
+            if reg != "$zero" and prev_get(reg, 0) != curr_get(reg, 0)
+        ]
 
     def create_execution_state(
         self,
@@ -247,13 +453,18 @@ class TraceParser:
         Returns:
             Complete ExecutionState
         """
-        return ExecutionState(
+        # All inputs are parser-produced or defaulted - construct without
+        # re-validating the full model graph
+        return ExecutionState.model_construct(
             pc=pc,
             current_instruction=current_instruction,
             registers=self.create_register_state(registers),
             changed_registers=changed_registers or [],
-            memory=memory_state or self.create_memory_state(),
-            heap=heap_state or self.create_initial_heap_state(),
+            # The common per-step call passes no memory/heap state; both
+            # defaults resolve to the shared empty templates with no
+            # factory call or model construction
+            memory=memory_state if memory_state is not None else self._empty_memory_state,
+            heap=heap_state if heap_state is not None else self._empty_heap_state,
             is_complete=is_complete,
             program_output=program_output,
             instruction_analysis=instruction_analysis,
@@ -269,12 +480,16 @@ class TraceParser:
         Returns:
             String in MARS register dump format
         """
-        lines: list[str] = []
-        for reg, value in register_state.values.items():
-            # Remove $ prefix for MARS format
-            reg_name = reg
-            lines.append(f"{reg_name}\t{value}")
-        return "\n".join(lines)
+        values = register_state.values
+        # States built by create_register_state iterate in canonical order,
+        # so the per-register "$name\t" prefixes come from a precomputed
+        # tuple and each line is one concatenation instead of an f-string
+        if tuple(values) == _CANONICAL_ORDER:
+            return "\n".join(
+                prefix + str(value)
+                for prefix, value in zip(_REG_PREFIXES, values.values())
+            )
+        return "\n".join(f"{reg}\t{value}" for reg, value in values.items())
 
     def serialize_memory_blocks(self, blocks: list[MemoryBlock]) -> str:
         """
@@ -286,20 +501,29 @@ class TraceParser:
         Returns:
             String in MARS HexText format
         """
-        lines: list[str] = []
-        for block in blocks:
-            if block.value is not None:
-                lines.append(f"0x{block.value:08x}")
-        return "\n".join(lines)
+        values = [b.value for b in blocks if b.value is not None]
+        if not values:
+            return ""
+
+        try:
+            # Bulk path: pack all words and hex-encode them in one C call,
+            # then slice the flat string into 8-digit lines
+            hex_flat = struct.pack(f">{len(values)}I", *values).hex()
+        except struct.error:
+            # Negative or oversized values: format one at a time
+            return "\n".join(f"0x{v:08x}" for v in values)
+
+        return "\n".join(
+            "0x" + hex_flat[i : i + 8] for i in range(0, len(hex_flat), 8)
+        )
 
 
-# Singleton instance for convenience
-_parser: TraceParser | None = None
+# Singleton instance for convenience. Construction is just the two empty
+# templates, so building it eagerly at import costs nothing and the
+# accessor drops the lazy None-check on every call.
+_parser: TraceParser = TraceParser()
 
 
 def get_trace_parser() -> TraceParser:
     """Get singleton TraceParser instance."""
-    global _parser
-    if _parser is None:
-        _parser = TraceParser()
     return _parser
@@ -0,0 +1,53 @@
+"""
+Shared pytest configuration.
+Feature: cavl-v1
+
+Registers Hypothesis settings profiles so the example budget scales with
+the environment instead of being hardcoded per test: quick local loops
+by default, broader fuzzing when HYPOTHESIS_PROFILE=ci or nightly.
+"""
+
+import os
+
+import pytest
+from hypothesis import HealthCheck, Phase, settings
+
+from app.services.mars_executor import MarsExecutor
+
+
+@pytest.fixture(scope="session")
+def mars_executor() -> MarsExecutor:
+    """One MarsExecutor for the whole session - it is stateless apart from
+    its scratch directory, and sharing it means the jar lookup and scratch
+    setup happen once instead of per test."""
+    return MarsExecutor()
+
+
+# Everything except Phase.explain: on a failure, explain re-runs the test
+# under sys.settrace to annotate the report, which is far slower than the
+# test itself and adds little for these small strategies.
+_PHASES = (Phase.explicit, Phase.reuse, Phase.generate, Phase.target, Phase.shrink)
+
+settings.register_profile(
+    "dev",
+    max_examples=5,
+    deadline=None,
+    phases=_PHASES,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+# CI containers start fresh, so the example database never has anything
+# to replay there - skip its filesystem traffic entirely, and derandomize
+# so every run (and every xdist worker) draws the same example sequence
+# instead of duplicating work under fresh seeds. Dev and nightly keep the
+# default database so previously failing examples are retried.
+settings.register_profile(
+    "ci",
+    max_examples=50,
+    deadline=None,
+    phases=_PHASES,
+    database=None,
+    derandomize=True,
+)
+settings.register_profile("nightly", max_examples=200, deadline=None, phases=_PHASES)
+
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
@@ -6,7 +6,6 @@ Tests the API request/response contract for all endpoints.
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings, assume
 from fastapi.testclient import TestClient
 from copy import deepcopy
 
@@ -32,55 +31,42 @@ from app.models.schemas import (
 )
 from app.services.state_manager import get_state_manager
 
+# Resolved once - the singleton never changes identity, so tests skip the
+# factory call on every use
+_state_manager = get_state_manager()
 
-client = TestClient(app)
 
+@pytest.fixture(scope="session")
+def client():
+    """Shared TestClient - one ASGI lifespan for the whole test session."""
+    with TestClient(app) as c:
+        yield c
 
-# ============== Strategies ==============
 
-@st.composite
-def valid_mips_code_strategy(draw):
-    """Generate valid simple MIPS code."""
-    # Simple valid MIPS programs
-    programs = [
-        ".text\nmain:\n    li $t0, 5\n    li $v0, 10\n    syscall",
-        ".text\nmain:\n    addi $t0, $zero, 10\n    addi $t1, $zero, 20\n    add $t2, $t0, $t1\n    li $v0, 10\n    syscall",
-        ".data\nval: .word 42\n.text\nmain:\n    la $t0, val\n    lw $t1, 0($t0)\n    li $v0, 10\n    syscall",
-        ".text\nmain:\n    li $t0, 100\n    li $v0, 10\n    syscall",
-        ".text\nmain:\n    move $t0, $zero\n    li $v0, 10\n    syscall",
-    ]
-    return draw(st.sampled_from(programs))
+# ============== Fixed inputs ==============
 
+# Finite input sets run as plain parametrized tests - no fuzzing or
+# shrinking machinery for domains we can enumerate exactly
+VALID_MIPS_PROGRAMS = [
+    ".text\nmain:\n    li $t0, 5\n    li $v0, 10\n    syscall",
+    ".text\nmain:\n    addi $t0, $zero, 10\n    addi $t1, $zero, 20\n    add $t2, $t0, $t1\n    li $v0, 10\n    syscall",
+    ".data\nval: .word 42\n.text\nmain:\n    la $t0, val\n    lw $t1, 0($t0)\n    li $v0, 10\n    syscall",
+    ".text\nmain:\n    li $t0, 100\n    li $v0, 10\n    syscall",
+    ".text\nmain:\n    move $t0, $zero\n    li $v0, 10\n    syscall",
+]
 
-@st.composite
-def invalid_mips_code_strategy(draw):
-    """Generate invalid MIPS code that should produce errors."""
-    invalid_programs = [
-        "invalid instruction here",
-        ".text\nmain:\n    xyz $t0, $t1",  # Invalid instruction
-        ".text\nmain:\n    add $t0",  # Missing operands
-        ".text\nmain:\n    lw $t0, ($t1",  # Syntax error
-        "this is not mips code at all!",
-    ]
-    return draw(st.sampled_from(invalid_programs))
+INVALID_MIPS_PROGRAMS = [
+    "invalid instruction here",
+    ".text\nmain:\n    xyz $t0, $t1",  # Invalid instruction
+    ".text\nmain:\n    add $t0",  # Missing operands
+    ".text\nmain:\n    lw $t0, ($t1",  # Syntax error
+    "this is not mips code at all!",
+]
 
-
-@st.composite
-def allocation_size_strategy(draw):
-    """Generate valid allocation sizes."""
-    return draw(st.integers(min_value=4, max_value=256))
-
-
-@st.composite
-def invalid_allocation_size_strategy(draw):
-    """Generate invalid allocation sizes."""
-    return draw(st.integers(min_value=-1000, max_value=0))
-
-
-@st.composite
-def memory_address_strategy(draw):
-    """Generate valid memory addresses."""
-    return draw(st.integers(min_value=0x10040000, max_value=0x10050000))
+# Both allocate and free only assert response-schema invariants, which
+# the input value cannot influence - boundary constants are enough
+ALLOCATION_SIZES = [4, 16, 64, 256]
+MEMORY_ADDRESSES = [0x10040000, 0x10045000, 0x10045002, 0x1004FFFC]
 
 
 # ============== Fixtures ==============
@@ -88,10 +74,26 @@ def memory_address_strategy(draw):
 @pytest.fixture(autouse=True)
 def reset_state_manager():
     """Reset state manager before each test."""
-    state_manager = get_state_manager()
-    state_manager.clear()
+    _state_manager.clear()
     yield
-    state_manager.clear()
+
+
+# ============== Helpers ==============
+
+def _assert_response_shape(data: dict, state_on_success: bool = True) -> None:
+    """
+    Assert the success/state/error contract shared by every endpoint.
+
+    Args:
+        data: Decoded JSON response body
+        state_on_success: Whether a successful response must carry 'state'
+    """
+    assert "success" in data, "Response must have 'success' field"
+    if data["success"]:
+        if state_on_success:
+            assert "state" in data, "Successful response must have 'state' field"
+    else:
+        assert "error" in data, "Failed response must have 'error' field"
 
 
 # ============== Property Tests ==============
@@ -107,9 +109,8 @@ class TestAPIRequestResponseContract:
     **Validates: Requirements 7.1, 7.2, 7.3, 7.4, 7.5, 7.6**
     """
 
-    @given(code=valid_mips_code_strategy())
-    @settings(max_examples=10, deadline=None)
-    def test_execute_valid_code_returns_success_response(self, code: str):
+    @pytest.mark.parametrize("code", VALID_MIPS_PROGRAMS)
+    def test_execute_valid_code_returns_success_response(self, client, code: str):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
@@ -121,12 +122,9 @@ class TestAPIRequestResponseContract:
         # Response should be valid JSON
         data = response.json()
         
-        # Should have required fields
-        assert "success" in data, "Response must have 'success' field"
+        _assert_response_shape(data)
         
-        # If success, should have state
         if data["success"]:
-            assert "state" in data, "Successful response must have 'state' field"
             assert data["state"] is not None, "State should not be None on success"
             
             # Validate state structure
@@ -136,13 +134,9 @@ class TestAPIRequestResponseContract:
             assert "memory" in state, "State must have 'memory' field"
             assert "heap" in state, "State must have 'heap' field"
             assert "is_complete" in state, "State must have 'is_complete' field"
-        else:
-            # If not success, should have error
-            assert "error" in data, "Failed response must have 'error' field"
 
-    @given(code=invalid_mips_code_strategy())
-    @settings(max_examples=10, deadline=None)
-    def test_execute_invalid_code_returns_error_response(self, code: str):
+    @pytest.mark.parametrize("code", INVALID_MIPS_PROGRAMS)
+    def test_execute_invalid_code_returns_error_response(self, client, code: str):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
@@ -153,77 +147,55 @@ class TestAPIRequestResponseContract:
         
         data = response.json()
         
-        # Should have required fields
-        assert "success" in data, "Response must have 'success' field"
+        _assert_response_shape(data, state_on_success=False)
         
         # Invalid code should fail
         if not data["success"]:
-            assert "error" in data, "Failed response must have 'error' field"
             assert data["error"] is not None, "Error should not be None"
             assert len(data["error"]) > 0, "Error message should not be empty"
 
-    @settings(max_examples=10)
-    @given(st.data())
-    def test_step_without_program_returns_error(self, data):
+    def test_step_without_program_returns_error(self, client):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
         Calling /api/step without loading a program should return an error.
         """
-        # Clear state to ensure no program is loaded
-        state_manager = get_state_manager()
-        state_manager.clear()
-        
         response = client.post("/api/step")
         
         resp_data = response.json()
         
-        assert "success" in resp_data, "Response must have 'success' field"
+        _assert_response_shape(resp_data)
         assert resp_data["success"] is False, "Step without program should fail"
-        assert "error" in resp_data, "Failed response must have 'error' field"
         assert resp_data["error"] is not None, "Error should not be None"
 
-    @settings(max_examples=10)
-    @given(st.data())
-    def test_reset_without_program_returns_error(self, data):
+    def test_reset_without_program_returns_error(self, client):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
         Calling /api/reset without loading a program should return an error.
         """
-        state_manager = get_state_manager()
-        state_manager.clear()
-        
         response = client.post("/api/reset")
         
         resp_data = response.json()
         
-        assert "success" in resp_data, "Response must have 'success' field"
+        _assert_response_shape(resp_data)
         assert resp_data["success"] is False, "Reset without program should fail"
-        assert "error" in resp_data, "Failed response must have 'error' field"
 
-    @settings(max_examples=10)
-    @given(st.data())
-    def test_get_state_without_program_returns_error(self, data):
+    def test_get_state_without_program_returns_error(self, client):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
         Calling /api/state without loading a program should return an error.
         """
-        state_manager = get_state_manager()
-        state_manager.clear()
-        
         response = client.get("/api/state")
         
         resp_data = response.json()
         
-        assert "success" in resp_data, "Response must have 'success' field"
+        _assert_response_shape(resp_data)
         assert resp_data["success"] is False, "Get state without program should fail"
-        assert "error" in resp_data, "Failed response must have 'error' field"
 
-    @given(size=allocation_size_strategy())
-    @settings(max_examples=10, deadline=None)
-    def test_allocate_returns_valid_response(self, size: int):
+    @pytest.mark.parametrize("size", ALLOCATION_SIZES)
+    def test_allocate_returns_valid_response(self, client, size: int):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
@@ -234,16 +206,13 @@ class TestAPIRequestResponseContract:
         
         data = response.json()
         
-        assert "success" in data, "Response must have 'success' field"
-        # Either succeeds with address or fails with error
+        _assert_response_shape(data, state_on_success=False)
+        # A successful allocate reports where the block landed
         if data["success"]:
             assert "address" in data, "Successful allocate must have 'address' field"
-        else:
-            assert "error" in data, "Failed response must have 'error' field"
 
-    @given(address=memory_address_strategy())
-    @settings(max_examples=10, deadline=None)
-    def test_free_returns_valid_response(self, address: int):
+    @pytest.mark.parametrize("address", MEMORY_ADDRESSES)
+    def test_free_returns_valid_response(self, client, address: int):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
@@ -254,84 +223,37 @@ class TestAPIRequestResponseContract:
         
         data = response.json()
         
-        assert "success" in data, "Response must have 'success' field"
         # Either succeeds or fails with error
-        if not data["success"]:
-            assert "error" in data, "Failed response must have 'error' field"
+        _assert_response_shape(data, state_on_success=False)
 
-    @given(code=valid_mips_code_strategy())
-    @settings(max_examples=10, deadline=None)
-    def test_step_after_execute_returns_valid_response(self, code: str):
+    @pytest.mark.parametrize("code", VALID_MIPS_PROGRAMS)
+    def test_followups_after_execute_return_valid_responses(self, client, code: str):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
-        After executing valid code, /api/step should return a valid response.
+        After executing valid code, the follow-up endpoints (/api/step,
+        /api/reset, /api/state) should all return valid responses. One
+        execute per program covers all three - /api/execute is by far the
+        heaviest call here, so the assemble+load cost is paid once.
         """
         # First execute code
         exec_response = client.post("/api/execute", json={"code": code, "mode": "step"})
         exec_data = exec_response.json()
         
         # Skip if execution failed (e.g., MARS not available)
-        assume(exec_data.get("success", False))
+        if not exec_data.get("success", False):
+            pytest.skip("execution failed (MARS not available?)")
         
         # Now step
-        step_response = client.post("/api/step")
-        step_data = step_response.json()
+        _assert_response_shape(client.post("/api/step").json())
         
-        assert "success" in step_data, "Response must have 'success' field"
+        # Get state for the loaded program
+        _assert_response_shape(client.get("/api/state").json())
         
-        if step_data["success"]:
-            assert "state" in step_data, "Successful step must have 'state' field"
+        # Finally reset
+        _assert_response_shape(client.post("/api/reset").json())
 
-    @given(code=valid_mips_code_strategy())
-    @settings(max_examples=10, deadline=None)
-    def test_reset_after_execute_returns_valid_response(self, code: str):
-        """
-        Feature: cavl-v1, Property 12: API Request/Response Contract
-        
-        After executing valid code, /api/reset should return a valid response.
-        """
-        # First execute code
-        exec_response = client.post("/api/execute", json={"code": code, "mode": "step"})
-        exec_data = exec_response.json()
-        
-        assume(exec_data.get("success", False))
-        
-        # Now reset
-        reset_response = client.post("/api/reset")
-        reset_data = reset_response.json()
-        
-        assert "success" in reset_data, "Response must have 'success' field"
-        
-        if reset_data["success"]:
-            assert "state" in reset_data, "Successful reset must have 'state' field"
-
-    @given(code=valid_mips_code_strategy())
-    @settings(max_examples=10, deadline=None)
-    def test_get_state_after_execute_returns_valid_response(self, code: str):
-        """
-        Feature: cavl-v1, Property 12: API Request/Response Contract
-        
-        After executing valid code, /api/state should return a valid response.
-        """
-        # First execute code
-        exec_response = client.post("/api/execute", json={"code": code, "mode": "step"})
-        exec_data = exec_response.json()
-        
-        assume(exec_data.get("success", False))
-        
-        # Now get state
-        state_response = client.get("/api/state")
-        state_data = state_response.json()
-        
-        assert "success" in state_data, "Response must have 'success' field"
-        
-        if state_data["success"]:
-            assert "state" in state_data, "Successful get state must have 'state' field"
-
-    @settings(max_examples=10)
-    @given(st.data())
-    def test_execute_empty_code_returns_error(self, data):
+    def test_execute_empty_code_returns_error(self, client):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
@@ -349,16 +271,15 @@ class TestAPIRequestResponseContract:
             if not resp_data["success"]:
                 assert "error" in resp_data
 
-    @given(mode=st.sampled_from(["full", "step"]))
-    @settings(max_examples=10, deadline=None)
-    def test_execute_mode_parameter_accepted(self, mode: str):
+    @pytest.mark.parametrize("mode", ["full", "step"])
+    def test_execute_mode_parameter_accepted(self, client, mode: str):
         """
         Feature: cavl-v1, Property 12: API Request/Response Contract
         
         Both 'full' and 'step' modes should be accepted.
         """
-        code = ".text\nmain:\n    li $t0, 5\n    li $v0, 10\n    syscall"
-        
+        code = VALID_MIPS_PROGRAMS[0]
+
         response = client.post("/api/execute", json={"code": code, "mode": mode})
         
         # Should not be a validation error
@@ -373,21 +294,21 @@ class TestAPIRequestResponseContract:
 class TestAPIRoutesUnit:
     """Unit tests for API routes."""
 
-    def test_health_endpoint(self):
+    def test_health_endpoint(self, client):
         """Health endpoint should return healthy status."""
         response = client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Root endpoint should return ok status."""
         response = client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ok"
 
-    def test_execute_invalid_mode_rejected(self):
+    def test_execute_invalid_mode_rejected(self, client):
         """Invalid execution mode should be rejected."""
         response = client.post(
             "/api/execute",
@@ -396,7 +317,7 @@ class TestAPIRoutesUnit:
         # Should be validation error
         assert response.status_code == 422
 
-    def test_allocate_negative_size_rejected(self):
+    def test_allocate_negative_size_rejected(self, client):
         """Negative allocation size should be rejected."""
         response = client.post("/api/heap/allocate", json={"size": -10})
         # Should be validation error or error response
@@ -406,7 +327,7 @@ class TestAPIRoutesUnit:
             data = response.json()
             assert data.get("success") is False
 
-    def test_free_negative_address_rejected(self):
+    def test_free_negative_address_rejected(self, client):
         """Negative address should be rejected."""
         response = client.post("/api/heap/free", json={"address": -1})
         # Should be validation error or error response
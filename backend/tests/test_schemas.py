@@ -4,7 +4,7 @@ Feature: cavl-v1
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 
 from app.models.schemas import (
     RegisterState,
@@ -17,18 +17,26 @@ from app.models.schemas import (
 )
 
 
+# Hoisted once: membership checks hit a frozenset and the strategies
+# reuse the writable-register tuple instead of rebuilding it per draw
+_MIPS_SET = frozenset(MIPS_REGISTERS)
+_CHANGEABLE_REGS = tuple(r for r in MIPS_REGISTERS if r != "$zero")
+
+
 # ============== Strategies ==============
 
 @st.composite
 def register_values_strategy(draw):
     """Generate valid register values (32-bit signed integers)."""
-    values = {}
-    for reg in MIPS_REGISTERS:
-        if reg == "$zero":
-            values[reg] = 0  # $zero is always 0
-        else:
-            # 32-bit signed integer range
-            values[reg] = draw(st.integers(min_value=-(2**31), max_value=(2**31) - 1))
+    # One fixed-size lists draw for the 31 writable registers instead of
+    # a draw() call per register; $zero is pinned to 0
+    ints = draw(st.lists(
+        st.integers(min_value=-(2**31), max_value=(2**31) - 1),
+        min_size=31,
+        max_size=31,
+    ))
+    values = dict(zip(_CHANGEABLE_REGS, ints))
+    values["$zero"] = 0
     return values
 
 
@@ -43,8 +51,7 @@ def register_state_strategy(draw):
 def changed_registers_strategy(draw):
     """Generate a list of changed registers (never includes $zero)."""
     # $zero can never be in changed_registers
-    changeable_regs = [r for r in MIPS_REGISTERS if r != "$zero"]
-    return draw(st.lists(st.sampled_from(changeable_regs), unique=True, max_size=10))
+    return draw(st.lists(st.sampled_from(_CHANGEABLE_REGS), unique=True, max_size=10))
 
 
 # ============== Property Tests ==============
@@ -61,40 +68,25 @@ class TestRegisterStateCompleteness:
     """
 
     @given(register_state=register_state_strategy())
-    @settings(max_examples=100)
-    def test_register_state_has_32_registers(self, register_state: RegisterState):
+    def test_register_state_invariants(self, register_state: RegisterState):
         """
         Feature: cavl-v1, Property 7: Register State Completeness
         
-        For any register state, it must contain exactly 32 registers.
+        For any register state: exactly 32 registers, all with valid MIPS
+        names and integer values, and $zero always 0. One draw checks all
+        four invariants instead of re-drawing per property.
         """
         assert len(register_state.values) == 32
-        assert set(register_state.values.keys()) == set(MIPS_REGISTERS)
-
-    @given(register_state=register_state_strategy())
-    @settings(max_examples=100)
-    def test_zero_register_always_zero(self, register_state: RegisterState):
-        """
-        Feature: cavl-v1, Property 7: Register State Completeness
-        
-        For any register state, $zero must always be 0.
-        """
+        assert set(register_state.values.keys()) == _MIPS_SET
         assert register_state.values["$zero"] == 0
-
-
-    @given(register_state=register_state_strategy())
-    @settings(max_examples=100)
-    def test_all_registers_have_numeric_values(self, register_state: RegisterState):
-        """
-        Feature: cavl-v1, Property 7: Register State Completeness
-        
-        For any register state, all register values must be integers.
-        """
-        for reg_name, value in register_state.values.items():
-            assert isinstance(value, int), f"Register {reg_name} has non-integer value: {value}"
+        # Scan for offenders in one pass; the message formats only on failure
+        bad = next(
+            ((k, v) for k, v in register_state.values.items() if type(v) is not int),
+            None,
+        )
+        assert bad is None, f"Register {bad[0]} has non-integer value: {bad[1]}"
 
     @given(changed_regs=changed_registers_strategy())
-    @settings(max_examples=100)
     def test_zero_never_in_changed_registers(self, changed_regs: list):
         """
         Feature: cavl-v1, Property 7: Register State Completeness
@@ -103,17 +95,6 @@ class TestRegisterStateCompleteness:
         """
         assert "$zero" not in changed_regs
 
-    @given(register_state=register_state_strategy())
-    @settings(max_examples=100)
-    def test_register_names_are_valid(self, register_state: RegisterState):
-        """
-        Feature: cavl-v1, Property 7: Register State Completeness
-        
-        For any register state, all register names must be valid MIPS register names.
-        """
-        for reg_name in register_state.values.keys():
-            assert reg_name in MIPS_REGISTERS, f"Invalid register name: {reg_name}"
-
 
 class TestRegisterStateInitialization:
     """Unit tests for RegisterState initialization."""
@@ -4,8 +4,8 @@ Feature: cavl-v1
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings, assume
-from copy import deepcopy
+from array import array
+from hypothesis import given, strategies as st
 
 from app.services.state_manager import StateManager, get_state_manager
 from app.models.schemas import (
@@ -21,6 +21,16 @@ from app.models.schemas import (
 )
 
 
+# Hoisted once: the writable registers (everything but $zero) feed the
+# strategies and the change-detection loops on every example
+CHANGEABLE_REGISTERS = tuple(r for r in MIPS_REGISTERS if r != "$zero")
+
+
+# The tests only round-trip instruction text, so draw it from a small
+# fixed pool instead of a per-character Unicode-category filter
+_INSTR_POOL = ("", "nop", "addi $t0, $zero, 1", "lw $t0, 0($sp)", "xxx", "aBc 12 !?")
+
+
 # ============== Strategies ==============
 
 @st.composite
@@ -35,44 +45,49 @@ def register_state_strategy(draw):
     return RegisterState(values=values)
 
 
-@st.composite
-def memory_block_strategy(draw, base_address):
-    """Generate a valid memory block at a given base address."""
-    return MemoryBlock(
-        address=base_address,
-        size=4,
-        value=draw(st.integers(min_value=0, max_value=0xFFFFFFFF)),
-    )
-
-
-@st.composite
-def memory_segment_strategy(draw, start_addr, end_addr):
-    """Generate a valid memory segment."""
-    num_blocks = draw(st.integers(min_value=0, max_value=5))
-    blocks = []
-    for i in range(num_blocks):
-        addr = start_addr + (i * 4)
-        if addr < end_addr:
-            blocks.append(MemoryBlock(
-                address=addr,
-                size=4,
-                value=draw(st.integers(min_value=0, max_value=0xFFFFFFFF)),
-            ))
-    return MemorySegment(
-        start_address=start_addr,
-        end_address=end_addr,
-        blocks=blocks,
-    )
+# Segment address ranges used by the memory strategy, in model order
+_SEGMENT_BOUNDS = (
+    (0x00400000, 0x00410000),  # text
+    (0x10010000, 0x10020000),  # data
+    (0x10040000, 0x10050000),  # heap
+    (0x7FFEF000, 0x7FFFEFFC),  # stack
+)
 
 
 @st.composite
 def memory_state_strategy(draw):
     """Generate a valid MemoryState with all four segments."""
+    # One composite frame for the whole state: draw the four block counts
+    # and a flat value list up front instead of nesting a sub-composite
+    # per segment and per block
+    counts = draw(st.lists(
+        st.integers(min_value=0, max_value=5), min_size=4, max_size=4
+    ))
+    total = sum(counts)
+    values = draw(st.lists(
+        st.integers(min_value=0, max_value=0xFFFFFFFF),
+        min_size=total,
+        max_size=total,
+    ))
+    segments = []
+    idx = 0
+    for (start_addr, end_addr), count in zip(_SEGMENT_BOUNDS, counts):
+        blocks = [
+            MemoryBlock(address=start_addr + (i * 4), size=4, value=values[idx + i])
+            for i in range(count)
+            if start_addr + (i * 4) < end_addr
+        ]
+        idx += count
+        segments.append(MemorySegment(
+            start_address=start_addr,
+            end_address=end_addr,
+            blocks=blocks,
+        ))
     return MemoryState(
-        text=draw(memory_segment_strategy(0x00400000, 0x00410000)),
-        data=draw(memory_segment_strategy(0x10010000, 0x10020000)),
-        heap=draw(memory_segment_strategy(0x10040000, 0x10050000)),
-        stack=draw(memory_segment_strategy(0x7FFEF000, 0x7FFFEFFC)),
+        text=segments[0],
+        data=segments[1],
+        heap=segments[2],
+        stack=segments[3],
     )
 
 
@@ -115,16 +130,16 @@ def execution_state_strategy(draw):
     """Generate a valid ExecutionState."""
     return ExecutionState(
         pc=draw(st.integers(min_value=0x00400000, max_value=0x00410000)) & ~3,
-        current_instruction=draw(st.text(min_size=0, max_size=50, alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'Z')))),
-        registers=draw(register_state_strategy()),
+        current_instruction=draw(st.sampled_from(_INSTR_POOL)),
+        registers=draw(REGISTER_STATE_STRATEGY),
         changed_registers=draw(st.lists(
-            st.sampled_from([r for r in MIPS_REGISTERS if r != "$zero"]),
+            st.sampled_from(CHANGEABLE_REGISTERS),
             min_size=0,
             max_size=5,
             unique=True,
         )),
-        memory=draw(memory_state_strategy()),
-        heap=draw(heap_state_strategy()),
+        memory=draw(MEMORY_STATE_STRATEGY),
+        heap=draw(HEAP_STATE_STRATEGY),
         is_complete=draw(st.booleans()),
     )
 
@@ -135,18 +150,11 @@ def execution_trace_strategy(draw, min_size=1, max_size=10):
     size = draw(st.integers(min_value=min_size, max_value=max_size))
     states = []
     for i in range(size):
-        state = draw(execution_state_strategy())
-        # Mark last state as complete
+        state = draw(EXECUTION_STATE_STRATEGY)
+        # Mark last state as complete - model_copy shares the already
+        # validated nested models instead of re-running construction
         if i == size - 1:
-            state = ExecutionState(
-                pc=state.pc,
-                current_instruction=state.current_instruction,
-                registers=state.registers,
-                changed_registers=state.changed_registers,
-                memory=state.memory,
-                heap=state.heap,
-                is_complete=True,
-            )
+            state = state.model_copy(update={"is_complete": True})
         states.append(state)
     return states
 
@@ -174,10 +182,10 @@ def sequential_pc_trace_strategy(draw, min_size=2, max_size=10):
         state = ExecutionState(
             pc=pc,
             current_instruction=instruction,
-            registers=draw(register_state_strategy()),
+            registers=draw(REGISTER_STATE_STRATEGY),
             changed_registers=[],
-            memory=draw(memory_state_strategy()),
-            heap=draw(heap_state_strategy()),
+            memory=draw(MEMORY_STATE_STRATEGY),
+            heap=draw(HEAP_STATE_STRATEGY),
             is_complete=(i == size - 1),
         )
         states.append(state)
@@ -210,40 +218,80 @@ def trace_with_register_changes_strategy(draw, min_size=2, max_size=5):
         curr_registers = prev_registers.copy()
         
         # Randomly change some registers (not $zero)
-        changeable_regs = [r for r in MIPS_REGISTERS if r != "$zero"]
         num_changes = draw(st.integers(min_value=0, max_value=3))
         regs_to_change = draw(st.lists(
-            st.sampled_from(changeable_regs),
+            st.sampled_from(CHANGEABLE_REGISTERS),
             min_size=num_changes,
             max_size=num_changes,
             unique=True,
         ))
         
         for reg in regs_to_change:
-            # Change to a different value
+            # Change to a different value: one draw, then a deterministic
+            # bump on collision instead of rejection-sampling more draws
             new_val = draw(st.integers(min_value=0, max_value=(2**31) - 1))
-            # Ensure it's actually different
-            while new_val == curr_registers[reg]:
-                new_val = draw(st.integers(min_value=0, max_value=(2**31) - 1))
+            if new_val == curr_registers[reg]:
+                new_val = (new_val + 1) & 0x7FFFFFFF
             curr_registers[reg] = new_val
         
+        # One snapshot serves both the state and the next iteration's
+        # baseline - pydantic validation copies it into the model anyway
+        snapshot = dict(curr_registers)
         state = ExecutionState(
             pc=pc,
             current_instruction=f"instruction_{i}",
-            registers=RegisterState(values=curr_registers.copy()),
+            registers=RegisterState(values=snapshot),
             changed_registers=[],  # Will be computed by StateManager
-            memory=draw(memory_state_strategy()),
-            heap=draw(heap_state_strategy()),
+            memory=draw(MEMORY_STATE_STRATEGY),
+            heap=draw(HEAP_STATE_STRATEGY),
             is_complete=(i == size - 1),
         )
         states.append(state)
         
         # Update prev_registers for next iteration
-        prev_registers = curr_registers.copy()
+        prev_registers = snapshot
     
     return states
 
 
+# Shared templates for the unit tests - every test reads the same
+# initial registers, empty memory layout, and empty heap, so build each
+# once and treat them as immutable
+_INITIAL_REGS = RegisterState.create_initial()
+_EMPTY_MEMORY = MemoryState(
+    text=MemorySegment(start_address=0x00400000, end_address=0x00400004, blocks=[]),
+    data=MemorySegment(start_address=0x10010000, end_address=0x10010000, blocks=[]),
+    heap=MemorySegment(start_address=0x10040000, end_address=0x10040000, blocks=[]),
+    stack=MemorySegment(start_address=0x7FFEF000, end_address=0x7FFFEFFC, blocks=[]),
+)
+_EMPTY_HEAP = HeapState(blocks=[], free_list=[], fragmentation=0.0)
+
+
+# Strategy objects are immutable, so build each once and share - the
+# trace strategies otherwise constructed a fresh composite wrapper for
+# every draw of a nested state
+REGISTER_STATE_STRATEGY = register_state_strategy()
+MEMORY_STATE_STRATEGY = memory_state_strategy()
+HEAP_STATE_STRATEGY = heap_state_strategy()
+EXECUTION_STATE_STRATEGY = execution_state_strategy()
+
+
+# ============== Fixtures ==============
+
+@pytest.fixture(scope="class")
+def manager():
+    """One StateManager reused across a test class - load_trace replaces
+    all per-trace state, so examples just reload instead of reallocating."""
+    return StateManager()
+
+
+# ============== Helpers ==============
+
+def _segment_snapshot(segment: MemorySegment) -> tuple:
+    """Snapshot the fields the reset tests compare (addresses, block count)."""
+    return (segment.start_address, segment.end_address, len(segment.blocks))
+
+
 # ============== Property Tests ==============
 
 class TestStepExecutionAdvancesPC:
@@ -258,19 +306,20 @@ class TestStepExecutionAdvancesPC:
     """
 
     @given(trace=sequential_pc_trace_strategy(min_size=2, max_size=10))
-    @settings(max_examples=100)
-    def test_step_advances_to_next_state_pc(self, trace):
+    def test_step_advances_to_next_state_pc(self, manager, trace):
         """
         Feature: cavl-v1, Property 4: Step Execution Advances PC
         
         For any non-terminated trace, stepping should advance to the next state's PC.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
-        # Get initial state
+        # Get initial state. With min_size=2 the strategy only marks the
+        # final state complete, so the first never is - assert the
+        # invariant instead of burning an assume() on it.
         initial_state = manager.get_current_state()
-        assume(not initial_state.is_complete)  # Skip if already complete
+        assert not initial_state.is_complete
         
         # Step
         new_state = manager.step()
@@ -281,14 +330,13 @@ class TestStepExecutionAdvancesPC:
             f"PC not advanced correctly: expected {hex(expected_pc)}, got {hex(new_state.pc)}"
 
     @given(trace=sequential_pc_trace_strategy(min_size=3, max_size=10))
-    @settings(max_examples=100)
-    def test_step_returns_correct_instruction_text(self, trace):
+    def test_step_returns_correct_instruction_text(self, manager, trace):
         """
         Feature: cavl-v1, Property 4: Step Execution Advances PC
         
         For any step, the returned state should contain the correct instruction text.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         # Step once
@@ -300,32 +348,31 @@ class TestStepExecutionAdvancesPC:
             f"Instruction mismatch: expected '{expected_instruction}', got '{new_state.current_instruction}'"
 
     @given(trace=sequential_pc_trace_strategy(min_size=2, max_size=5))
-    @settings(max_examples=100)
-    def test_multiple_steps_advance_pc_sequentially(self, trace):
+    def test_multiple_steps_advance_pc_sequentially(self, manager, trace):
         """
         Feature: cavl-v1, Property 4: Step Execution Advances PC
         
         For any trace, multiple steps should advance PC through each state sequentially.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
-        # Step through all states and verify PC at each step
+        # Step through all states and verify PC at each step; hoist the
+        # expected PCs so the loop does one list index per step
+        expected_pcs = [s.pc for s in trace]
         for i in range(len(trace) - 1):
             state = manager.step()
-            expected_pc = trace[i + 1].pc
-            assert state.pc == expected_pc, \
-                f"Step {i+1}: PC mismatch - expected {hex(expected_pc)}, got {hex(state.pc)}"
+            assert state.pc == expected_pcs[i + 1], \
+                f"Step {i+1}: PC mismatch - expected {hex(expected_pcs[i + 1])}, got {hex(state.pc)}"
 
     @given(trace=sequential_pc_trace_strategy(min_size=2, max_size=5))
-    @settings(max_examples=100)
-    def test_step_at_end_returns_complete_state(self, trace):
+    def test_step_at_end_returns_complete_state(self, manager, trace):
         """
         Feature: cavl-v1, Property 4: Step Execution Advances PC
         
         For any trace, stepping at the end should return a state with is_complete=True.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         # Step to the end
@@ -347,30 +394,29 @@ class TestRegisterChangeDetection:
     """
 
     @given(trace=trace_with_register_changes_strategy(min_size=2, max_size=5))
-    @settings(max_examples=100)
-    def test_changed_registers_contains_exactly_changed_values(self, trace):
+    def test_changed_registers_contains_exactly_changed_values(self, manager, trace):
         """
         Feature: cavl-v1, Property 5: Register Change Detection
         
         For any step, changedRegisters should contain exactly the registers
         whose values differ between previous and current state.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         # Step and check changed registers
         prev_state = manager.get_current_state()
         new_state = manager.step()
         
-        # Compute expected changed registers
-        expected_changed = set()
-        for reg in MIPS_REGISTERS:
-            if reg == "$zero":
-                continue  # $zero never changes
-            prev_val = prev_state.registers.values.get(reg, 0)
-            curr_val = new_state.registers.values.get(reg, 0)
-            if prev_val != curr_val:
-                expected_changed.add(reg)
+        # Compute expected changed registers. The strategy builds every
+        # values dict in canonical MIPS_REGISTERS order, so the dicts
+        # flatten straight into int arrays and the comparison runs on
+        # ordinals with no string hashing ($zero sits at index 0).
+        prev_arr = array("i", prev_state.registers.values.values())
+        curr_arr = array("i", new_state.registers.values.values())
+        expected_changed = {
+            MIPS_REGISTERS[i] for i in range(1, 32) if prev_arr[i] != curr_arr[i]
+        }
         
         actual_changed = set(new_state.changed_registers)
         
@@ -378,14 +424,13 @@ class TestRegisterChangeDetection:
             f"Changed registers mismatch: expected {expected_changed}, got {actual_changed}"
 
     @given(trace=trace_with_register_changes_strategy(min_size=3, max_size=5))
-    @settings(max_examples=100)
-    def test_zero_register_never_in_changed_list(self, trace):
+    def test_zero_register_never_in_changed_list(self, manager, trace):
         """
         Feature: cavl-v1, Property 5: Register Change Detection
         
         For any step, $zero should never appear in changedRegisters.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         # Step through all states
@@ -395,47 +440,48 @@ class TestRegisterChangeDetection:
                 "$zero should never appear in changedRegisters"
 
     @given(trace=trace_with_register_changes_strategy(min_size=2, max_size=5))
-    @settings(max_examples=100)
-    def test_unchanged_registers_not_in_changed_list(self, trace):
+    def test_unchanged_registers_not_in_changed_list(self, manager, trace):
         """
         Feature: cavl-v1, Property 5: Register Change Detection
         
         For any step, registers with unchanged values should not appear in changedRegisters.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         prev_state = manager.get_current_state()
         new_state = manager.step()
         
-        # Check that unchanged registers are not in the list
-        for reg in MIPS_REGISTERS:
-            if reg == "$zero":
-                continue
-            prev_val = prev_state.registers.values.get(reg, 0)
-            curr_val = new_state.registers.values.get(reg, 0)
-            if prev_val == curr_val:
-                assert reg not in new_state.changed_registers, \
-                    f"Unchanged register {reg} should not be in changedRegisters"
+        # Check that unchanged registers are not in the list - one set
+        # build gives O(1) membership, and the ordinal arrays (canonical
+        # dict order, see above) avoid per-register dict probes
+        changed = frozenset(new_state.changed_registers)
+        prev_arr = array("i", prev_state.registers.values.values())
+        curr_arr = array("i", new_state.registers.values.values())
+        for i in range(1, 32):
+            if prev_arr[i] == curr_arr[i]:
+                assert MIPS_REGISTERS[i] not in changed, \
+                    f"Unchanged register {MIPS_REGISTERS[i]} should not be in changedRegisters"
 
     @given(trace=trace_with_register_changes_strategy(min_size=2, max_size=5))
-    @settings(max_examples=100)
-    def test_all_changed_registers_actually_changed(self, trace):
+    def test_all_changed_registers_actually_changed(self, manager, trace):
         """
         Feature: cavl-v1, Property 5: Register Change Detection
         
         For any step, all registers in changedRegisters should have actually changed.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         prev_state = manager.get_current_state()
         new_state = manager.step()
         
         # Verify each register in changedRegisters actually changed
+        prev_vals = prev_state.registers.values
+        curr_vals = new_state.registers.values
         for reg in new_state.changed_registers:
-            prev_val = prev_state.registers.values.get(reg, 0)
-            curr_val = new_state.registers.values.get(reg, 0)
+            prev_val = prev_vals.get(reg, 0)
+            curr_val = curr_vals.get(reg, 0)
             assert prev_val != curr_val, \
                 f"Register {reg} in changedRegisters but value didn't change: {prev_val} -> {curr_val}"
 
@@ -451,25 +497,26 @@ class TestResetRestoresInitialState:
     """
 
     @given(trace=execution_trace_strategy(min_size=2, max_size=10))
-    @settings(max_examples=100)
-    def test_reset_restores_initial_state(self, trace):
+    def test_reset_restores_initial_state(self, manager, trace):
         """
         Feature: cavl-v1, Property 6: Reset Restores Initial State
         
         For any execution trace, after stepping through and resetting,
         the state should be identical to the initial state.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
-        # Capture initial state
+        # Capture initial state. The checks below only read scalars, so a
+        # shallow dict copy and address/count snapshots replace deepcopy's
+        # full model-graph walk.
         initial_state = manager.get_current_state()
         initial_pc = initial_state.pc
-        initial_registers = deepcopy(initial_state.registers.values)
-        initial_memory_text = deepcopy(initial_state.memory.text)
-        initial_memory_data = deepcopy(initial_state.memory.data)
-        initial_memory_heap = deepcopy(initial_state.memory.heap)
-        initial_memory_stack = deepcopy(initial_state.memory.stack)
+        initial_registers = dict(initial_state.registers.values)
+        initial_memory_text = _segment_snapshot(initial_state.memory.text)
+        initial_memory_data = _segment_snapshot(initial_state.memory.data)
+        initial_memory_heap = _segment_snapshot(initial_state.memory.heap)
+        initial_memory_stack = _segment_snapshot(initial_state.memory.stack)
         
         # Step through some states
         num_steps = len(trace) // 2 + 1
@@ -489,23 +536,19 @@ class TestResetRestoresInitialState:
                 f"Register {reg} not restored: expected {initial_registers[reg]}, got {reset_state.registers.values[reg]}"
         
         # Verify memory segments restored
-        assert reset_state.memory.text.start_address == initial_memory_text.start_address
-        assert reset_state.memory.text.end_address == initial_memory_text.end_address
-        assert len(reset_state.memory.text.blocks) == len(initial_memory_text.blocks)
-        
-        assert reset_state.memory.data.start_address == initial_memory_data.start_address
-        assert reset_state.memory.heap.start_address == initial_memory_heap.start_address
-        assert reset_state.memory.stack.start_address == initial_memory_stack.start_address
+        assert _segment_snapshot(reset_state.memory.text) == initial_memory_text
+        assert reset_state.memory.data.start_address == initial_memory_data[0]
+        assert reset_state.memory.heap.start_address == initial_memory_heap[0]
+        assert reset_state.memory.stack.start_address == initial_memory_stack[0]
 
     @given(trace=execution_trace_strategy(min_size=1, max_size=5))
-    @settings(max_examples=100)
-    def test_reset_returns_to_index_zero(self, trace):
+    def test_reset_returns_to_index_zero(self, manager, trace):
         """
         Feature: cavl-v1, Property 6: Reset Restores Initial State
         
         For any trace, reset should return the step index to 0.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         # Step forward
@@ -520,14 +563,13 @@ class TestResetRestoresInitialState:
             f"Step index not reset: expected 0, got {manager.get_step_index()}"
 
     @given(trace=execution_trace_strategy(min_size=2, max_size=5))
-    @settings(max_examples=100)
-    def test_multiple_resets_produce_same_state(self, trace):
+    def test_multiple_resets_produce_same_state(self, manager, trace):
         """
         Feature: cavl-v1, Property 6: Reset Restores Initial State
         
         For any trace, multiple resets should always produce the same initial state.
         """
-        manager = StateManager()
+        manager.clear()
         manager.load_trace(trace)
         
         # First reset after stepping
@@ -535,16 +577,16 @@ class TestResetRestoresInitialState:
         manager.step()
         first_reset = manager.reset()
         first_pc = first_reset.pc
-        first_registers = deepcopy(first_reset.registers.values)
+        first_registers = first_reset.registers.values.copy()
         
         # Step again and reset
         manager.step()
         second_reset = manager.reset()
         
-        # Verify same state
+        # Verify same state - one C-level dict comparison covers all 32
+        # registers
         assert second_reset.pc == first_pc
-        for reg in MIPS_REGISTERS:
-            assert second_reset.registers.values[reg] == first_registers[reg]
+        assert second_reset.registers.values == first_registers
 
 
 class TestStateManagerUnit:
@@ -557,15 +599,10 @@ class TestStateManagerUnit:
         state = ExecutionState(
             pc=0x00400000,
             current_instruction="addi $t0, $zero, 5",
-            registers=RegisterState.create_initial(),
+            registers=_INITIAL_REGS,
             changed_registers=[],
-            memory=MemoryState(
-                text=MemorySegment(start_address=0x00400000, end_address=0x00400004, blocks=[]),
-                data=MemorySegment(start_address=0x10010000, end_address=0x10010000, blocks=[]),
-                heap=MemorySegment(start_address=0x10040000, end_address=0x10040000, blocks=[]),
-                stack=MemorySegment(start_address=0x7FFEF000, end_address=0x7FFFEFFC, blocks=[]),
-            ),
-            heap=HeapState(blocks=[], free_list=[], fragmentation=0.0),
+            memory=_EMPTY_MEMORY,
+            heap=_EMPTY_HEAP,
             is_complete=False,
         )
         
@@ -583,15 +620,10 @@ class TestStateManagerUnit:
             ExecutionState(
                 pc=0x00400000 + (i * 4),
                 current_instruction=f"instruction_{i}",
-                registers=RegisterState.create_initial(),
+                registers=_INITIAL_REGS,
                 changed_registers=[],
-                memory=MemoryState(
-                    text=MemorySegment(start_address=0x00400000, end_address=0x00400004, blocks=[]),
-                    data=MemorySegment(start_address=0x10010000, end_address=0x10010000, blocks=[]),
-                    heap=MemorySegment(start_address=0x10040000, end_address=0x10040000, blocks=[]),
-                    stack=MemorySegment(start_address=0x7FFEF000, end_address=0x7FFFEFFC, blocks=[]),
-                ),
-                heap=HeapState(blocks=[], free_list=[], fragmentation=0.0),
+                memory=_EMPTY_MEMORY,
+                heap=_EMPTY_HEAP,
                 is_complete=(i == 2),
             )
             for i in range(3)
@@ -612,15 +644,10 @@ class TestStateManagerUnit:
         state = ExecutionState(
             pc=0x00400000,
             current_instruction="syscall",
-            registers=RegisterState.create_initial(),
+            registers=_INITIAL_REGS,
             changed_registers=[],
-            memory=MemoryState(
-                text=MemorySegment(start_address=0x00400000, end_address=0x00400004, blocks=[]),
-                data=MemorySegment(start_address=0x10010000, end_address=0x10010000, blocks=[]),
-                heap=MemorySegment(start_address=0x10040000, end_address=0x10040000, blocks=[]),
-                stack=MemorySegment(start_address=0x7FFEF000, end_address=0x7FFFEFFC, blocks=[]),
-            ),
-            heap=HeapState(blocks=[], free_list=[], fragmentation=0.0),
+            memory=_EMPTY_MEMORY,
+            heap=_EMPTY_HEAP,
             is_complete=True,
         )
         
@@ -637,15 +664,10 @@ class TestStateManagerUnit:
         state = ExecutionState(
             pc=0x00400000,
             current_instruction="nop",
-            registers=RegisterState.create_initial(),
+            registers=_INITIAL_REGS,
             changed_registers=[],
-            memory=MemoryState(
-                text=MemorySegment(start_address=0x00400000, end_address=0x00400004, blocks=[]),
-                data=MemorySegment(start_address=0x10010000, end_address=0x10010000, blocks=[]),
-                heap=MemorySegment(start_address=0x10040000, end_address=0x10040000, blocks=[]),
-                stack=MemorySegment(start_address=0x7FFEF000, end_address=0x7FFFEFFC, blocks=[]),
-            ),
-            heap=HeapState(blocks=[], free_list=[], fragmentation=0.0),
+            memory=_EMPTY_MEMORY,
+            heap=_EMPTY_HEAP,
             is_complete=False,
         )
         
@@ -662,6 +684,7 @@ class TestStateManagerUnit:
         with pytest.raises(ValueError, match="Cannot load empty trace"):
             manager.load_trace([])
 
+    @pytest.mark.xdist_group("singleton")
     def test_singleton_pattern(self):
         """Test singleton pattern for get_state_manager."""
         manager1 = get_state_manager()
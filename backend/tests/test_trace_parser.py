@@ -3,68 +3,112 @@ Property-based tests for trace parser.
 Feature: cavl-v1
 """
 
+import random
+from array import array
+
 import pytest
-from hypothesis import given, strategies as st, settings, assume
 
-from app.services.trace_parser import TraceParser, get_trace_parser
+from app.services.trace_parser import get_trace_parser
 from app.models.schemas import (
-    RegisterState,
     MemoryBlock,
     MIPS_REGISTERS,
 )
 
-
-# ============== Strategies ==============
-
-@st.composite
-def register_values_strategy(draw):
-    """Generate valid register values (32-bit signed integers)."""
-    values = {}
-    for reg in MIPS_REGISTERS:
-        if reg == "$zero":
-            values[reg] = 0
-        else:
-            values[reg] = draw(st.integers(min_value=-(2**31), max_value=(2**31) - 1))
-    return values
-
-
-@st.composite
-def mars_register_output_strategy(draw):
-    """Generate MARS-style register output."""
-    lines = []
-    values = {}
-    for reg in MIPS_REGISTERS:
-        if reg == "$zero":
-            value = 0
-        else:
-            value = draw(st.integers(min_value=0, max_value=(2**31) - 1))
-        values[reg] = value
-        lines.append(f"{reg}\t{value}")
-    return '\n'.join(lines), values
-
-
-@st.composite
-def memory_block_strategy(draw):
-    """Generate a valid memory block."""
-    address = draw(st.integers(min_value=0, max_value=0x7FFFFFFF)) & ~3  # Word-aligned
-    value = draw(st.integers(min_value=0, max_value=0xFFFFFFFF))
-    return MemoryBlock(address=address, size=4, value=value)
-
-
-@st.composite
-def memory_blocks_strategy(draw, min_size=1, max_size=10):
-    """Generate a list of memory blocks with sequential addresses."""
-    start_address = draw(st.integers(min_value=0x10010000, max_value=0x10020000)) & ~3
-    count = draw(st.integers(min_value=min_size, max_value=max_size))
-    blocks = []
-    for i in range(count):
-        value = draw(st.integers(min_value=0, max_value=0xFFFFFFFF))
-        blocks.append(MemoryBlock(
-            address=start_address + (i * 4),
-            size=4,
-            value=value,
-        ))
-    return blocks
+# Under pytest-xdist (pytest -n auto --dist=loadscope) keep this module's
+# many tiny parametrized cases on one worker - scattering them costs more
+# in scheduling than their runtime saves
+pytestmark = pytest.mark.xdist_group("trace_parser")
+
+
+# ============== Deterministic case generation ==============
+
+# Pre-generated corpora replace the Hypothesis strategies that used to
+# drive these tests: on inputs this small the framework overhead (strategy
+# drawing, shrinking bookkeeping) dwarfed the actual parser calls. Fixed
+# seeds keep every run reproducible while parametrize pays only for the
+# test body itself. Coverage on a linear, deterministic parser saturates
+# quickly, so a small random sample plus explicit boundary cases is enough.
+_CASE_COUNT = 25
+
+# $zero is the only register with fixed contents - split it out once so
+# the generators and assertions below never re-test the name in a loop
+_NONZERO_REGS = tuple(r for r in MIPS_REGISTERS if r != "$zero")
+
+# Value bounds, bound once at module scope
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+_UINT32_MAX = 0xFFFFFFFF
+
+
+def _build_register_values_cases() -> list[dict[str, int]]:
+    """Random register maps (32-bit signed values, $zero pinned to 0)."""
+    rng = random.Random(42)
+    cases = []
+    for _ in range(_CASE_COUNT):
+        values = {reg: rng.randint(_INT32_MIN, _INT32_MAX) for reg in _NONZERO_REGS}
+        values["$zero"] = 0
+        cases.append(values)
+    # Boundary corners the random sample is unlikely to hit exactly
+    for corner in (0, _INT32_MIN, _INT32_MAX):
+        values = dict.fromkeys(_NONZERO_REGS, corner)
+        values["$zero"] = 0
+        cases.append(values)
+    return cases
+
+
+def _build_register_output_cases() -> list[tuple[str, dict[str, int]]]:
+    """MARS-style register dumps paired with their expected values."""
+    rng = random.Random(43)
+    cases = []
+    for _ in range(_CASE_COUNT):
+        values = {reg: rng.randint(0, _INT32_MAX) for reg in _NONZERO_REGS}
+        values["$zero"] = 0
+        cases.append(values)
+    # Boundary corners: every register at the domain edge
+    for corner in (0, _INT32_MAX):
+        values = dict.fromkeys(_NONZERO_REGS, corner)
+        values["$zero"] = 0
+        cases.append(values)
+    return [
+        ("\n".join(f"{reg}\t{value}" for reg, value in values.items()), values)
+        for values in cases
+    ]
+
+
+def _build_memory_blocks_cases() -> list[list[tuple[int, int]]]:
+    """Word-aligned (address, value) runs with sequential addresses.
+
+    Plain tuples, not MemoryBlock - the models only get materialized
+    inside the test, so corpus construction skips pydantic validation.
+    """
+    rng = random.Random(44)
+    cases = []
+    for _ in range(_CASE_COUNT):
+        start_address = rng.randint(0x10010000, 0x10020000) & ~3  # Word-aligned
+        count = rng.randint(1, 10)
+        # One randbytes call per case; the bytes decode to uint32 words in
+        # C instead of drawing each value through a Python-level randint
+        words = array("I")
+        words.frombytes(rng.randbytes(4 * count))
+        cases.append([
+            (start_address + (i * 4), value) for i, value in enumerate(words)
+        ])
+    # Boundary corners: single-word dumps at the value edges
+    for corner in (0, _UINT32_MAX):
+        cases.append([(0x10010000, corner)])
+    return cases
+
+
+REGISTER_VALUES_CASES = _build_register_values_cases()
+REGISTER_OUTPUT_CASES = _build_register_output_cases()
+MEMORY_BLOCKS_CASES = _build_memory_blocks_cases()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """One parser for the whole session - it is stateless, and the
+    singleton accessor is what the app itself uses."""
+    return get_trace_parser()
 
 
 # ============== Property Tests ==============
@@ -72,126 +116,106 @@ def memory_blocks_strategy(draw, min_size=1, max_size=10):
 class TestTraceParsingRoundTrip:
     """
     Property 9: MARS Trace Parsing Round-Trip
-    
-    *For any* valid MARS execution output, parsing the trace into structured data 
+
+    *For any* valid MARS execution output, parsing the trace into structured data
     and serializing back SHALL preserve all register values and memory addresses.
-    
+
     **Validates: Requirements 2.2, 2.3**
     """
 
-    @given(data=mars_register_output_strategy())
-    @settings(max_examples=100)
-    def test_register_parsing_preserves_values(self, data):
+    @pytest.mark.parametrize("data", REGISTER_OUTPUT_CASES)
+    def test_register_parsing_preserves_values(self, parser, data):
         """
         Feature: cavl-v1, Property 9: MARS Trace Parsing Round-Trip
-        
+
         For any MARS register output, parsing should preserve all register values.
         """
         output, expected_values = data
-        parser = TraceParser()
-        
+
         parsed = parser.parse_register_dump(output)
-        
-        for reg, expected_val in expected_values.items():
-            assert reg in parsed, f"Register {reg} not found in parsed output"
-            assert parsed[reg] == expected_val, f"Register {reg}: expected {expected_val}, got {parsed[reg]}"
 
+        # One C-level dict comparison; pytest still diffs the dicts on failure
+        assert parsed == expected_values
 
-    @given(blocks=memory_blocks_strategy())
-    @settings(max_examples=100)
-    def test_memory_serialization_round_trip(self, blocks):
+
+    @pytest.mark.parametrize("pairs", MEMORY_BLOCKS_CASES)
+    def test_memory_serialization_round_trip(self, parser, pairs):
         """
         Feature: cavl-v1, Property 9: MARS Trace Parsing Round-Trip
-        
+
         For any memory blocks, serializing and parsing should preserve addresses and values.
         """
-        parser = TraceParser()
-        
+        blocks = [MemoryBlock(address=a, size=4, value=v) for a, v in pairs]
+
         # Serialize to MARS format
         serialized = parser.serialize_memory_blocks(blocks)
-        
+
         # Parse back
-        start_address = blocks[0].address if blocks else 0x10010000
-        parsed_blocks = parser.parse_memory_dump(serialized, start_address)
-        
-        # Verify values preserved
-        assert len(parsed_blocks) == len(blocks)
-        for orig, parsed in zip(blocks, parsed_blocks):
-            assert parsed.value == orig.value, f"Value mismatch at {orig.address}"
-            assert parsed.address == orig.address, f"Address mismatch"
-
-    @given(values=register_values_strategy())
-    @settings(max_examples=100)
-    def test_register_state_creation_preserves_values(self, values):
+        parsed_blocks = parser.parse_memory_dump(serialized, pairs[0][0])
+
+        # Verify values preserved - compare (address, value) pairs in one shot
+        assert [(b.address, b.value) for b in parsed_blocks] == pairs
+
+    @pytest.mark.parametrize("values", REGISTER_VALUES_CASES)
+    def test_register_state_creation_preserves_values(self, parser, values):
         """
         Feature: cavl-v1, Property 9: MARS Trace Parsing Round-Trip
-        
+
         For any register values, creating RegisterState should preserve all values.
         """
-        parser = TraceParser()
-        
         state = parser.create_register_state(values)
-        
-        for reg in MIPS_REGISTERS:
-            if reg == "$zero":
-                assert state.values[reg] == 0
-            else:
-                assert state.values[reg] == values.get(reg, 0)
-
-    @given(values=register_values_strategy())
-    @settings(max_examples=100)
-    def test_register_serialization_round_trip(self, values):
+
+        # Corpus dicts cover all 32 registers with $zero pinned to 0, so
+        # the whole contract is one dict equality
+        assert state.values == values
+
+    @pytest.mark.parametrize("values", REGISTER_VALUES_CASES)
+    def test_register_serialization_round_trip(self, parser, values):
         """
         Feature: cavl-v1, Property 9: MARS Trace Parsing Round-Trip
-        
+
         For any register state, serializing and parsing should preserve values.
         """
-        parser = TraceParser()
-        
         # Create state
         state = parser.create_register_state(values)
-        
+
         # Serialize
         serialized = parser.serialize_registers(state)
-        
+
         # Parse back
         parsed = parser.parse_register_dump(serialized)
-        
+
         # Verify all values preserved
-        for reg in MIPS_REGISTERS:
-            expected = 0 if reg == "$zero" else values.get(reg, 0)
-            assert parsed.get(reg, 0) == expected, f"Register {reg} mismatch"
+        assert parsed == values
 
 
 class TestTraceParserUnit:
     """Unit tests for TraceParser."""
 
-    def test_parse_mars_register_output(self):
+    def test_parse_mars_register_output(self, parser):
         """Parse actual MARS register output format."""
         output = """$t0\t42
 $t1\t10
 $t2\t52
 $v0\t10
 $sp\t2147479548"""
-        
-        parser = TraceParser()
+
         result = parser.parse_register_dump(output)
-        
+
         assert result["$t0"] == 42
         assert result["$t1"] == 10
         assert result["$t2"] == 52
         assert result["$v0"] == 10
         assert result["$sp"] == 2147479548
 
-    def test_parse_memory_hex_dump(self):
+    def test_parse_memory_hex_dump(self, parser):
         """Parse MARS HexText memory dump format."""
         output = """0x00000001
 0x00000002
 0x00000003"""
-        
-        parser = TraceParser()
+
         blocks = parser.parse_memory_dump(output, start_address=0x10010000)
-        
+
         assert len(blocks) == 3
         assert blocks[0].address == 0x10010000
         assert blocks[0].value == 1
@@ -200,15 +224,13 @@ $sp\t2147479548"""
         assert blocks[2].address == 0x10010008
         assert blocks[2].value == 3
 
-    def test_detect_changed_registers(self):
+    def test_detect_changed_registers(self, parser):
         """Detect register changes between states."""
-        parser = TraceParser()
-        
         prev = {"$t0": 0, "$t1": 10, "$zero": 0}
         curr = {"$t0": 42, "$t1": 10, "$zero": 0}
-        
+
         changed = parser.detect_changed_registers(prev, curr)
-        
+
         assert "$t0" in changed
         assert "$t1" not in changed
         assert "$zero" not in changed